@@ -109,6 +109,9 @@ async def run_async_migrations() -> None:
         configuration,
         prefix="sqlalchemy.",
         poolclass=pool.NullPool,
+        # Same UTC session time zone as src.db.engine, so server-side
+        # timestamp defaults line up with application-written values
+        connect_args={"init_command": "SET time_zone = '+00:00'"},
     )
 
     async with connectable.connect() as connection:
@@ -0,0 +1,37 @@
+"""users_parent_role_index
+
+Revision ID: a3c5e7f9b1d4
+Revises: f2b4d6e8a0c3
+Create Date: 2026-10-16 21:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a3c5e7f9b1d4"
+down_revision: str | Sequence[str] | None = "f2b4d6e8a0c3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Online index build; it also serves the parent_id foreign key, so the
+    # single-column parent_id index can go afterwards
+    op.execute(
+        "CREATE INDEX ix_users_parent_role_time ON users "
+        "(parent_id, role, created_at) "
+        "ALGORITHM=INPLACE LOCK=NONE"
+    )
+    op.drop_index(op.f("ix_users_parent_id"), table_name="users")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f("ix_users_parent_id"), "users", ["parent_id"], unique=False)
+    op.drop_index("ix_users_parent_role_time", table_name="users")
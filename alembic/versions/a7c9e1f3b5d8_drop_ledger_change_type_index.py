@@ -0,0 +1,33 @@
+"""drop_ledger_change_type_index
+
+Revision ID: a7c9e1f3b5d8
+Revises: f6b8d0e2a4c7
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a7c9e1f3b5d8"
+down_revision: str | Sequence[str] | None = "f6b8d0e2a4c7"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # A handful of enum values: the index never narrows a scan, but every
+    # ledger insert pays for it
+    op.drop_index(op.f("ix_balance_ledgers_change_type"), table_name="balance_ledgers")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        op.f("ix_balance_ledgers_change_type"), "balance_ledgers", ["change_type"], unique=False
+    )
@@ -0,0 +1,56 @@
+"""wallet_webhook_timestamp_defaults
+
+Revision ID: b4d6f8a0c2e5
+Revises: a3c5e7f9b1d4
+Create Date: 2026-10-16 22:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b4d6f8a0c2e5"
+down_revision: str | Sequence[str] | None = "a3c5e7f9b1d4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TABLES = (
+    "wallets",
+    "webhook_providers",
+    "webhook_provider_chains",
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in TABLES:
+        op.alter_column(
+            table,
+            "created_at",
+            existing_type=sa.DateTime(),
+            server_default=sa.func.now(),
+            existing_nullable=False,
+        )
+        # ALTER COLUMN ... SET DEFAULT cannot carry ON UPDATE, so MODIFY the column
+        op.execute(
+            f"ALTER TABLE {table} MODIFY updated_at DATETIME NOT NULL "
+            "DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} MODIFY updated_at DATETIME NOT NULL")
+        op.alter_column(
+            table,
+            "created_at",
+            existing_type=sa.DateTime(),
+            server_default=None,
+            existing_nullable=False,
+        )
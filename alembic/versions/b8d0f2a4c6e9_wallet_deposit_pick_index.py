@@ -0,0 +1,39 @@
+"""wallet_deposit_pick_index
+
+Revision ID: b8d0f2a4c6e9
+Revises: a7c9e1f3b5d8
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b8d0f2a4c6e9"
+down_revision: str | Sequence[str] | None = "a7c9e1f3b5d8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Online index build; it also serves the user_id foreign key, so the
+    # single-column user_id / last_used_at indexes can go afterwards
+    op.execute(
+        "CREATE INDEX ix_wallets_deposit_pick ON wallets "
+        "(user_id, chain_id, wallet_type, is_active, last_used_at, created_at) "
+        "ALGORITHM=INPLACE LOCK=NONE"
+    )
+    op.drop_index(op.f("ix_wallets_user_id"), table_name="wallets")
+    op.drop_index(op.f("ix_wallets_last_used_at"), table_name="wallets")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f("ix_wallets_last_used_at"), "wallets", ["last_used_at"], unique=False)
+    op.create_index(op.f("ix_wallets_user_id"), "wallets", ["user_id"], unique=False)
+    op.drop_index("ix_wallets_deposit_pick", table_name="wallets")
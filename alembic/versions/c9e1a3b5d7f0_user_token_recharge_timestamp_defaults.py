@@ -0,0 +1,58 @@
+"""user_token_recharge_timestamp_defaults
+
+Revision ID: c9e1a3b5d7f0
+Revises: b8d0f2a4c6e9
+Create Date: 2026-10-16 17:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c9e1a3b5d7f0"
+down_revision: str | Sequence[str] | None = "b8d0f2a4c6e9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+COLUMNS = (
+    ("users", "created_at"),
+    ("users", "updated_at"),
+    ("tokens", "created_at"),
+    ("tokens", "updated_at"),
+    ("token_chain_supports", "created_at"),
+    ("token_chain_supports", "updated_at"),
+    ("recharge_addresses", "created_at"),
+    ("recharge_addresses", "updated_at"),
+    ("recharge_orders", "created_at"),
+    ("recharge_orders", "updated_at"),
+    ("collect_tasks", "created_at"),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column in COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.DateTime(),
+            server_default=sa.func.now(),
+            existing_nullable=False,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column in COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.DateTime(),
+            server_default=None,
+            existing_nullable=False,
+        )
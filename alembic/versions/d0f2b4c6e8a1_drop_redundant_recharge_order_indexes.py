@@ -0,0 +1,35 @@
+"""drop_redundant_recharge_order_indexes
+
+Revision ID: d0f2b4c6e8a1
+Revises: c9e1a3b5d7f0
+Create Date: 2026-10-16 18:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d0f2b4c6e8a1"
+down_revision: str | Sequence[str] | None = "c9e1a3b5d7f0"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # status is the prefix of ix_recharge_orders_status_expires, and nothing
+    # filters on expires_at alone
+    op.drop_index(op.f("ix_recharge_orders_status"), table_name="recharge_orders")
+    op.drop_index(op.f("ix_recharge_orders_expires_at"), table_name="recharge_orders")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        op.f("ix_recharge_orders_expires_at"), "recharge_orders", ["expires_at"], unique=False
+    )
+    op.create_index(op.f("ix_recharge_orders_status"), "recharge_orders", ["status"], unique=False)
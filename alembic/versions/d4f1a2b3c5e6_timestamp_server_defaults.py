@@ -0,0 +1,48 @@
+"""timestamp_server_defaults
+
+Revision ID: d4f1a2b3c5e6
+Revises: 07fb86469ded
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d4f1a2b3c5e6"
+down_revision: str | Sequence[str] | None = "07fb86469ded"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TABLES = ("chains", "fee_configs", "exchange_rate_sources", "exchange_rates")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in TABLES:
+        for column in ("created_at", "updated_at"):
+            op.alter_column(
+                table,
+                column,
+                existing_type=sa.DateTime(),
+                server_default=sa.func.now(),
+                existing_nullable=False,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        for column in ("created_at", "updated_at"):
+            op.alter_column(
+                table,
+                column,
+                existing_type=sa.DateTime(),
+                server_default=None,
+                existing_nullable=False,
+            )
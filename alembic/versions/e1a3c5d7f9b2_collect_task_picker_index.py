@@ -0,0 +1,43 @@
+"""collect_task_picker_index
+
+Revision ID: e1a3c5d7f9b2
+Revises: d0f2b4c6e8a1
+Create Date: 2026-10-16 19:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e1a3c5d7f9b2"
+down_revision: str | Sequence[str] | None = "d0f2b4c6e8a1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Pending/failed task pickers: WHERE status = ? AND chain_id = ? ORDER BY created_at
+    op.execute(
+        "CREATE INDEX ix_collect_tasks_status_chain_created ON collect_tasks "
+        "(status, chain_id, created_at) ALGORITHM=INPLACE LOCK=NONE"
+    )
+    # Both had status as their leading column and are covered by the new index
+    op.drop_index("ix_collect_tasks_status_scheduled", table_name="collect_tasks")
+    op.drop_index(op.f("ix_collect_tasks_status"), table_name="collect_tasks")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f("ix_collect_tasks_status"), "collect_tasks", ["status"], unique=False)
+    op.create_index(
+        "ix_collect_tasks_status_scheduled",
+        "collect_tasks",
+        ["status", "scheduled_at"],
+        unique=False,
+    )
+    op.drop_index("ix_collect_tasks_status_chain_created", table_name="collect_tasks")
@@ -0,0 +1,45 @@
+"""composite_ledger_order_indexes
+
+Revision ID: e5a7c9d1b3f2
+Revises: d4f1a2b3c5e6
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e5a7c9d1b3f2"
+down_revision: str | Sequence[str] | None = "d4f1a2b3c5e6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Online index builds; the composite indexes also serve the user_id /
+    # merchant_id foreign keys, so the single-column ones can go afterwards
+    op.execute(
+        "CREATE INDEX ix_ledger_user_time ON balance_ledgers "
+        "(user_id, created_at DESC, id) ALGORITHM=INPLACE LOCK=NONE"
+    )
+    op.execute(
+        "CREATE INDEX ix_orders_merchant_type_time ON orders "
+        "(merchant_id, order_type, created_at DESC) ALGORITHM=INPLACE LOCK=NONE"
+    )
+    op.drop_index(op.f("ix_balance_ledgers_user_id"), table_name="balance_ledgers")
+    op.drop_index(op.f("ix_orders_merchant_id"), table_name="orders")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f("ix_orders_merchant_id"), "orders", ["merchant_id"], unique=False)
+    op.create_index(
+        op.f("ix_balance_ledgers_user_id"), "balance_ledgers", ["user_id"], unique=False
+    )
+    op.drop_index("ix_orders_merchant_type_time", table_name="orders")
+    op.drop_index("ix_ledger_user_time", table_name="balance_ledgers")
@@ -0,0 +1,51 @@
+"""updated_at_on_update_current_timestamp
+
+Revision ID: f2b4d6e8a0c3
+Revises: e1a3c5d7f9b2
+Create Date: 2026-10-16 20:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f2b4d6e8a0c3"
+down_revision: str | Sequence[str] | None = "e1a3c5d7f9b2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TABLES = (
+    "chains",
+    "fee_configs",
+    "exchange_rate_sources",
+    "exchange_rates",
+    "merchant_settings",
+    "orders",
+    "users",
+    "tokens",
+    "token_chain_supports",
+    "recharge_addresses",
+    "recharge_orders",
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # ALTER COLUMN ... SET DEFAULT cannot carry ON UPDATE, so MODIFY the column
+    for table in TABLES:
+        op.execute(
+            f"ALTER TABLE {table} MODIFY updated_at DATETIME NOT NULL "
+            "DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        op.execute(
+            f"ALTER TABLE {table} MODIFY updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP"
+        )
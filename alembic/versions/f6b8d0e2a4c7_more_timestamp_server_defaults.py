@@ -0,0 +1,52 @@
+"""more_timestamp_server_defaults
+
+Revision ID: f6b8d0e2a4c7
+Revises: e5a7c9d1b3f2
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f6b8d0e2a4c7"
+down_revision: str | Sequence[str] | None = "e5a7c9d1b3f2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+COLUMNS = (
+    ("balance_ledgers", "created_at"),
+    ("orders", "created_at"),
+    ("orders", "updated_at"),
+    ("merchant_settings", "created_at"),
+    ("merchant_settings", "updated_at"),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column in COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.DateTime(),
+            server_default=sa.func.now(),
+            existing_nullable=False,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column in COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.DateTime(),
+            server_default=None,
+            existing_nullable=False,
+        )
@@ -1,6 +1,15 @@
-"""API module - route handlers and common dependencies."""
+"""API module - route handlers and common dependencies.
 
-from fastapi import FastAPI
+Router modules are imported lazily: ``register_routers`` imports each one as
+it is mounted, and ``src.api.<name>_router`` attributes resolve on first
+access (PEP 562). Set ``AKX_EAGER_IMPORT=1`` to import every router up front,
+e.g. in CI to surface import errors early.
+"""
+
+import importlib
+import os
+
+from fastapi import APIRouter, FastAPI
 
 from src.api.deps import (
     CurrentUser,
@@ -9,7 +18,41 @@ from src.api.deps import (
     totp_required,
 )
 
+# (module name, prefix, tags) in mount order
+ROUTER_SPECS: tuple[tuple[str, str, list[str] | None], ...] = (
+    # Auth & User management
+    ("auth", "/api", None),
+    ("totp", "/api", None),
+    ("users", "/api", None),
+    # Wallet & Asset management
+    ("wallets", "/api/wallets", ["Wallets"]),
+    # Order & Payment
+    ("orders", "/api", None),
+    ("payment", "", None),  # Payment API v1 (external)
+    # Recharge & Collection (Merchant balance top-up)
+    ("recharges", "/api", None),
+    # Ledger & Financial records
+    ("fee_configs", "/api", None),
+    ("ledger", "/api", None),
+    # Merchant Settings
+    ("merchant_settings", "/api", None),
+    # Exchange Rate management
+    ("exchange_rate_sources", "/api", None),
+    ("exchange_rates", "/api", None),
+    # Web3 & Blockchain
+    ("chains_tokens", "", None),
+    ("webhook_providers", "/api", None),
+    ("webhooks", "", None),  # Blockchain webhook callbacks
+    # Telegram Bot webhook
+    ("telegram_bot", "/api", None),
+    # Cashier (public payment pages)
+    ("cashier", "", None),  # Public pages at /pay/{order_no}
+)
+
+_ROUTER_ATTRS = {f"{name}_router": name for name, _, _ in ROUTER_SPECS}
+
 __all__ = [
+    "ROUTER_SPECS",
     "CurrentUser",
     "SuperAdmin",
     "TOTPUser",
@@ -18,72 +61,48 @@ __all__ = [
 ]
 
 
-def register_routers(app: FastAPI) -> None:
-    """Register all API routers to the application.
-
-    Args:
-        app: FastAPI application instance
-    """
-    # Auth & User management
-    from src.api.auth import router as auth_router
-    from src.api.totp import router as totp_router
-    from src.api.users import router as users_router
+def _load_router(name: str) -> APIRouter:
+    """Import ``src.api.<name>`` and return its ``router``."""
+    return importlib.import_module(f"{__name__}.{name}").router
 
-    app.include_router(auth_router, prefix="/api")
-    app.include_router(totp_router, prefix="/api")
-    app.include_router(users_router, prefix="/api")
 
-    # Wallet & Asset management
-    from src.api.wallets import router as wallets_router
+def __getattr__(attr: str) -> APIRouter:
+    """Resolve ``<name>_router`` attributes on first access."""
+    name = _ROUTER_ATTRS.get(attr)
+    if name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {attr!r}")
+    router = _load_router(name)
+    globals()[attr] = router
+    return router
 
-    app.include_router(wallets_router, prefix="/api/wallets", tags=["Wallets"])
 
-    # Order & Payment
-    from src.api.orders import router as orders_router
-    from src.api.payment import router as payment_router
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_ROUTER_ATTRS])
 
-    app.include_router(orders_router, prefix="/api")
-    app.include_router(payment_router)  # Payment API v1 (external)
 
-    # Recharge & Collection (Merchant balance top-up)
-    from src.api.recharges import router as recharges_router
-
-    app.include_router(recharges_router, prefix="/api")
-
-    # Ledger & Financial records
-    from src.api.fee_configs import router as fee_configs_router
-    from src.api.ledger import router as ledger_router
-
-    app.include_router(fee_configs_router, prefix="/api")
-    app.include_router(ledger_router, prefix="/api")
-
-    # Merchant Settings
-    from src.api.merchant_settings import router as merchant_settings_router
-
-    app.include_router(merchant_settings_router, prefix="/api")
-
-    # Exchange Rate management
-    from src.api.exchange_rate_sources import router as exchange_rate_sources_router
-    from src.api.exchange_rates import router as exchange_rates_router
-
-    app.include_router(exchange_rate_sources_router, prefix="/api")
-    app.include_router(exchange_rates_router, prefix="/api")
-
-    # Web3 & Blockchain
-    from src.api.chains_tokens import router as chains_tokens_router
-    from src.api.webhook_providers import router as webhook_providers_router
-    from src.api.webhooks import router as webhooks_router
-
-    app.include_router(chains_tokens_router)
-    app.include_router(webhook_providers_router, prefix="/api")
-    app.include_router(webhooks_router)  # Blockchain webhook callbacks
-
-    # Telegram Bot webhook
-    from src.api.telegram_bot import router as telegram_bot_router
-
-    app.include_router(telegram_bot_router, prefix="/api")
+def register_routers(app: FastAPI) -> None:
+    """Register all API routers to the application.
 
-    # Cashier (public payment pages)
-    from src.api.cashier import router as cashier_router
+    Sub-routers are composed into a single root router, whose routes are then
+    appended to the app router in one step instead of going through
+    ``app.include_router`` per module.
 
-    app.include_router(cashier_router)  # Public pages at /pay/{order_no}
+    Args:
+        app: FastAPI application instance
+    """
+    # Routes keep resolving app.dependency_overrides through the provider, and
+    # inherit the app's default response class / dependencies since they
+    # bypass app.include_router
+    root_router = APIRouter(
+        dependency_overrides_provider=app,
+        default_response_class=app.router.default_response_class,
+        dependencies=app.router.dependencies,
+    )
+    for name, prefix, tags in ROUTER_SPECS:
+        root_router.include_router(_load_router(name), prefix=prefix, tags=tags)
+    app.router.routes.extend(root_router.routes)
+
+
+if os.environ.get("AKX_EAGER_IMPORT") == "1":
+    for _attr in _ROUTER_ATTRS:
+        __getattr__(_attr)
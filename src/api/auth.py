@@ -222,12 +222,10 @@ async def get_me(
         # google_secret 是加密存储的，这里只检查是否存在
         # pending 状态的密钥以 "pending:" 开头（加密前）
         # 由于是加密的，我们需要解密后检查
-        from src.core.config import get_settings
-        from src.core.security import AESCipher
+        from src.core.security import get_cipher
 
         try:
-            cipher = AESCipher(get_settings().aes_encryption_key)
-            decrypted = cipher.decrypt(user.google_secret)
+            decrypted = get_cipher().decrypt(user.google_secret)
             totp_enabled = not decrypted.startswith("pending:")
         except Exception:
             totp_enabled = False
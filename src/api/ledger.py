@@ -13,7 +13,7 @@ from src.schemas.ledger import (
     BalanceLedgerResponse,
     ManualBalanceAdjustRequest,
 )
-from src.schemas.pagination import CustomPage
+from src.schemas.pagination import CustomPage, pagination_ctx
 from src.services.ledger_service import LedgerService
 
 router = APIRouter(prefix="/ledger", tags=["Ledger"])
@@ -29,7 +29,11 @@ def get_ledger_service(db=Depends(get_db)) -> LedgerService:
 # =============================================================================
 
 
-@router.get("/balance-ledgers", response_model=CustomPage[BalanceLedgerResponse])
+@router.get(
+    "/balance-ledgers",
+    response_model=CustomPage[BalanceLedgerResponse],
+    dependencies=[Depends(pagination_ctx(CustomPage[BalanceLedgerResponse]))],
+)
 async def list_balance_ledgers(
     user: CurrentUser,
     service: Annotated[LedgerService, Depends(get_ledger_service)],
@@ -18,7 +18,7 @@ from src.schemas.order import (
     OrderQueryParams,
     OrderResponse,
 )
-from src.schemas.pagination import CustomPage
+from src.schemas.pagination import CustomPage, pagination_ctx
 from src.services.order_service import OrderService
 
 router = APIRouter(prefix="/orders", tags=["Orders"])
@@ -34,7 +34,11 @@ def get_order_service(
 # ============ Deposit Orders ============
 
 
-@router.get("/deposits", response_model=CustomPage[OrderResponse])
+@router.get(
+    "/deposits",
+    response_model=CustomPage[OrderResponse],
+    dependencies=[Depends(pagination_ctx(CustomPage[OrderResponse]))],
+)
 async def list_deposit_orders(
     user: CurrentUser,
     service: Annotated[OrderService, Depends(get_order_service)],
@@ -69,7 +73,11 @@ async def list_deposit_orders(
 # ============ Withdraw Orders ============
 
 
-@router.get("/withdrawals", response_model=CustomPage[OrderResponse])
+@router.get(
+    "/withdrawals",
+    response_model=CustomPage[OrderResponse],
+    dependencies=[Depends(pagination_ctx(CustomPage[OrderResponse]))],
+)
 async def list_withdrawal_orders(
     user: CurrentUser,
     service: Annotated[OrderService, Depends(get_order_service)],
@@ -8,8 +8,7 @@ from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.deps import CurrentUser
-from src.core.config import get_settings
-from src.core.security import AESCipher
+from src.core.security import get_cipher
 from src.db import get_db
 
 router = APIRouter(prefix="/totp", tags=["TOTP"])
@@ -45,15 +44,6 @@ class TOTPStatusResponse(BaseModel):
     message: str
 
 
-# --- Helper Functions ---
-
-
-def get_cipher() -> AESCipher:
-    """Get AES cipher for encrypting/decrypting TOTP secrets."""
-    settings = get_settings()
-    return AESCipher(settings.aes_encryption_key)
-
-
 # --- API Endpoints ---
 
 
@@ -12,7 +12,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.api.deps import CurrentUser, SuperAdmin
 from src.db import get_db
 from src.models.user import User, UserRole
-from src.schemas.pagination import CustomPage
+from src.schemas.pagination import CustomPage, pagination_ctx
 from src.schemas.user import (
     InvitationResponse,
     InviteMerchantRequest,
@@ -51,7 +51,11 @@ def get_invitation_service(db: Annotated[AsyncSession, Depends(get_db)]) -> Invi
 # ============ API Endpoints ============
 
 
-@router.get("", response_model=CustomPage[UserResponse])
+@router.get(
+    "",
+    response_model=CustomPage[UserResponse],
+    dependencies=[Depends(pagination_ctx(CustomPage[UserResponse]))],
+)
 async def list_users(
     service: Annotated[UserService, Depends(get_user_service)],
     current_user: SuperAdmin,
@@ -13,7 +13,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.deps import CurrentUser
 from src.db import get_db
-from src.schemas.pagination import CustomPage
+from src.schemas.pagination import CustomPage, pagination_ctx
 from src.services.wallet_service import WalletService
 from src.utils.helpers import format_utc_datetime
 
@@ -156,7 +156,11 @@ async def get_asset_summary(
     return AssetSummaryResponse(**result)
 
 
-@router.get("", response_model=CustomPage[WalletResponse])
+@router.get(
+    "",
+    response_model=CustomPage[WalletResponse],
+    dependencies=[Depends(pagination_ctx(CustomPage[WalletResponse]))],
+)
 async def list_wallets(
     user: CurrentUser,
     service: Annotated[WalletService, Depends(get_wallet_service)],
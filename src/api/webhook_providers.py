@@ -12,7 +12,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.api.auth import get_current_user, require_super_admin
 from src.db.engine import get_db
 from src.models import User, WebhookProviderType
-from src.schemas.pagination import CustomPage
+from src.schemas.pagination import CustomPage, pagination_ctx
 from src.schemas.webhook_provider import (
     PROVIDER_TYPE_INFO,
     ProviderTypeInfo,
@@ -46,7 +46,11 @@ async def list_provider_types(
     return list(PROVIDER_TYPE_INFO.values())
 
 
-@router.get("", response_model=CustomPage[WebhookProviderResponse])
+@router.get(
+    "",
+    response_model=CustomPage[WebhookProviderResponse],
+    dependencies=[Depends(pagination_ctx(CustomPage[WebhookProviderResponse]))],
+)
 async def list_providers(
     _: Annotated[User, Depends(get_current_user)],
     service: Annotated[WebhookProviderService, Depends(get_webhook_provider_service)],
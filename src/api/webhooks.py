@@ -17,6 +17,7 @@ import logging
 from decimal import Decimal
 from typing import Annotated
 
+import orjson
 from fastapi import APIRouter, Depends, Header, HTTPException, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import and_, select
@@ -49,7 +50,7 @@ async def tron_webhook(
     No signature verification - relies on endpoint secrecy.
     """
     try:
-        body = await request.json()
+        body = orjson.loads(await request.body())
         logger.info(f"TRON webhook received: {body}")
 
         # TronGrid event format
@@ -140,7 +141,7 @@ async def alchemy_webhook(
                 if not hmac.compare_digest(expected, x_alchemy_signature):
                     raise HTTPException(status_code=401, detail="Invalid signature")
 
-        data = await request.json()
+        data = orjson.loads(await request.body())
         logger.info(f"Alchemy webhook received: {data}")
 
         webhook_type = data.get("type")
@@ -217,7 +218,7 @@ async def helius_webhook(
             if webhook_secret and authorization != webhook_secret:
                 raise HTTPException(status_code=401, detail="Invalid authorization")
 
-        body = await request.json()
+        body = orjson.loads(await request.body())
         logger.info(f"Helius webhook received: {body}")
 
         # Helius sends array of transactions
@@ -310,7 +311,7 @@ async def quicknode_webhook(
                     if not hmac.compare_digest(expected, x_qn_signature):
                         raise HTTPException(status_code=401, detail="Invalid signature")
 
-        data = await request.json()
+        data = orjson.loads(await request.body())
         logger.info(f"QuickNode webhook received: {data}")
 
         # QuickNode stream format
@@ -381,7 +382,7 @@ async def moralis_webhook(
                     if not hmac.compare_digest(expected, x_signature):
                         raise HTTPException(status_code=401, detail="Invalid signature")
 
-        data = await request.json()
+        data = orjson.loads(await request.body())
         logger.info(f"Moralis webhook received: {data}")
 
         # Moralis stream format
@@ -612,13 +613,11 @@ async def clerk_webhook(
 
     TODO: Implement Svix signature verification for production.
     """
-    import json
-
     body = await request.body()
 
     try:
-        payload = json.loads(body)
-    except json.JSONDecodeError:
+        payload = orjson.loads(body)
+    except orjson.JSONDecodeError:
         raise HTTPException(status_code=400, detail="Invalid JSON payload")
 
     event_type = payload.get("type")
@@ -638,8 +637,6 @@ async def _handle_clerk_user_created(db: AsyncSession, data: dict) -> None:
     This is called when a user completes registration via an invitation link.
     The role and other metadata are extracted from the invitation's public_metadata.
     """
-    from datetime import UTC, datetime
-
     from src.models.user import User, UserRole, generate_api_key
 
     clerk_id = data.get("id")
@@ -681,7 +678,6 @@ async def _handle_clerk_user_created(db: AsyncSession, data: dict) -> None:
         existing.email = email
         if username:
             existing.username = username
-        existing.updated_at = datetime.now(UTC)
         db.add(existing)
         await db.commit()
         return
@@ -713,8 +709,6 @@ async def _handle_clerk_user_deleted(db: AsyncSession, data: dict) -> None:
     When a user is deleted from Clerk, we deactivate them locally
     rather than deleting, to preserve audit trails.
     """
-    from datetime import UTC, datetime
-
     from src.models.user import User
 
     clerk_id = data.get("id")
@@ -726,7 +720,6 @@ async def _handle_clerk_user_deleted(db: AsyncSession, data: dict) -> None:
 
     if user:
         user.is_active = False
-        user.updated_at = datetime.now(UTC)
         db.add(user)
         await db.commit()
         logger.info(f"Deactivated user from Clerk webhook: {user.email}")
@@ -17,7 +17,7 @@ class TransactionStatus(str, Enum):
     FAILED = "failed"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TransactionResult:
     """Result of a blockchain transaction."""
 
@@ -28,7 +28,7 @@ class TransactionResult:
     status: TransactionStatus = TransactionStatus.PENDING
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TransactionInfo:
     """Information about a blockchain transaction."""
 
@@ -43,7 +43,7 @@ class TransactionInfo:
     timestamp: int | None = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WalletInfo:
     """Wallet information from blockchain."""
 
@@ -208,7 +208,8 @@ class BlockchainService(ABC):
         Returns:
             Amount in smallest unit as integer
         """
-        return int(amount * (10**decimals))
+        # scaleb shifts the exponent directly instead of multiplying by 10**decimals
+        return int(amount.scaleb(decimals))
 
     def from_smallest_unit(self, amount: int, decimals: int) -> Decimal:
         """Convert from smallest unit to standard unit.
@@ -220,4 +221,5 @@ class BlockchainService(ABC):
         Returns:
             Amount in standard unit as Decimal
         """
-        return Decimal(amount) / Decimal(10**decimals)
+        # Single Decimal construction; scaleb avoids a Decimal division per call
+        return Decimal(amount).scaleb(-decimals)
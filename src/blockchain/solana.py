@@ -4,14 +4,19 @@ Provides Solana-specific blockchain operations using solana-py library.
 """
 
 import logging
+import struct
 from decimal import Decimal
+from functools import lru_cache
 
 from solana.rpc.async_api import AsyncClient
 from solana.rpc.commitment import Confirmed
 from solders.keypair import Keypair
 from solders.pubkey import Pubkey
+from solders.signature import Signature
 from solders.system_program import TransferParams, transfer
 from solders.transaction import Transaction
+from spl.token.async_client import AsyncToken
+from spl.token.constants import TOKEN_PROGRAM_ID
 
 from src.blockchain.base import (
     BlockchainService,
@@ -27,6 +32,31 @@ logger = logging.getLogger(__name__)
 # SPL Token Program ID
 SPL_TOKEN_PROGRAM_ID = "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA"
 
+# SPL token account layout: mint (32) + owner (32) + amount (u64 LE) + rest (93) = 165 bytes
+SPL_ACCOUNT_LAYOUT = struct.Struct("<64xQ93x")
+SPL_AMOUNT_OFFSET = 64
+
+# Signature parsing is shared by get_transaction/get_transaction_confirmations,
+# which are typically called back-to-back for the same hash
+_parse_signature = lru_cache(maxsize=2048)(Signature.from_string)
+
+
+def _sum_spl_amounts(buffers: list[bytes]) -> int:
+    """Sum the u64 amount field across raw SPL token account buffers.
+
+    Fixed-size accounts are concatenated and unpacked in a single
+    ``iter_unpack`` pass; anything else falls back to per-account slicing.
+    """
+    size = SPL_ACCOUNT_LAYOUT.size
+    if all(len(buf) == size for buf in buffers):
+        return sum(amount for (amount,) in SPL_ACCOUNT_LAYOUT.iter_unpack(b"".join(buffers)))
+
+    total = 0
+    for buf in buffers:
+        if len(buf) >= SPL_AMOUNT_OFFSET + 8:
+            total += int.from_bytes(buf[SPL_AMOUNT_OFFSET : SPL_AMOUNT_OFFSET + 8], "little")
+    return total
+
 
 class SolanaService(BlockchainService):
     """Solana blockchain service implementation.
@@ -88,7 +118,7 @@ class SolanaService(BlockchainService):
                 return self.from_smallest_unit(response.value, 9)
             return Decimal("0")
         except Exception as e:
-            logger.error(f"Failed to get SOL balance for {address}: {e}")
+            logger.error("Failed to get SOL balance for %s: %s", address, e)
             return Decimal("0")
 
     async def get_token_balance(
@@ -114,22 +144,17 @@ class SolanaService(BlockchainService):
 
             if response.value:
                 # Sum up balances from all token accounts
-                total_balance = 0
-                for account in response.value:
-                    account_data = account.account.data
-                    # Parse account data to get balance
-                    # Token account data layout: mint (32) + owner (32) + amount (8) + ...
-                    if len(account_data) >= 72:
-                        amount_bytes = bytes(account_data[64:72])
-                        total_balance += int.from_bytes(amount_bytes, "little")
-
-                return self.from_smallest_unit(total_balance, decimals)
+                buffers = [bytes(account.account.data) for account in response.value]
+                return self.from_smallest_unit(_sum_spl_amounts(buffers), decimals)
 
             return Decimal("0")
 
         except Exception as e:
             logger.error(
-                f"Failed to get token balance for {address} (mint: {contract_address}): {e}"
+                "Failed to get token balance for %s (mint: %s): %s",
+                address,
+                contract_address,
+                e,
             )
             return Decimal("0")
 
@@ -177,7 +202,7 @@ class SolanaService(BlockchainService):
 
             if response.value:
                 tx_hash = str(response.value)
-                logger.info(f"SOL transfer successful: {tx_hash}")
+                logger.info("SOL transfer successful: %s", tx_hash)
                 return TransactionResult(
                     success=True,
                     tx_hash=tx_hash,
@@ -185,7 +210,7 @@ class SolanaService(BlockchainService):
                 )
             else:
                 error_msg = "Transaction failed"
-                logger.error(f"SOL transfer failed: {error_msg}")
+                logger.error("SOL transfer failed: %s", error_msg)
                 return TransactionResult(
                     success=False,
                     error=error_msg,
@@ -216,9 +241,6 @@ class SolanaService(BlockchainService):
         3. Handle token account rent exemption
         """
         try:
-            from spl.token.async_client import AsyncToken
-            from spl.token.constants import TOKEN_PROGRAM_ID
-
             # Create keypair from private key
             secret_key = bytes.fromhex(from_private_key)
             keypair = Keypair.from_seed(secret_key[:32])
@@ -273,7 +295,7 @@ class SolanaService(BlockchainService):
 
             if response.value:
                 tx_hash = str(response.value)
-                logger.info(f"SPL token transfer successful: {tx_hash}")
+                logger.info("SPL token transfer successful: %s", tx_hash)
                 return TransactionResult(
                     success=True,
                     tx_hash=tx_hash,
@@ -299,9 +321,7 @@ class SolanaService(BlockchainService):
     async def get_transaction(self, tx_hash: str) -> TransactionInfo | None:
         """Get transaction details."""
         try:
-            from solders.signature import Signature
-
-            signature = Signature.from_string(tx_hash)
+            signature = _parse_signature(tx_hash)
             response = await self._client.get_transaction(
                 signature,
                 max_supported_transaction_version=0,
@@ -328,13 +348,14 @@ class SolanaService(BlockchainService):
             amount = Decimal("0")
             token = "SOL"
 
-            # Try to get account keys
-            message = tx.transaction.transaction.message
-            if hasattr(message, "account_keys"):
-                keys = message.account_keys
-                if len(keys) >= 2:
-                    from_address = str(keys[0])
-                    to_address = str(keys[1])
+            # Try to get account keys (not every encoded message variant exposes them)
+            try:
+                keys = tx.transaction.transaction.message.account_keys
+            except AttributeError:
+                keys = []
+            if len(keys) >= 2:
+                from_address = str(keys[0])
+                to_address = str(keys[1])
 
             # Get pre/post balances to calculate amount
             if meta and meta.pre_balances and meta.post_balances:
@@ -353,20 +374,18 @@ class SolanaService(BlockchainService):
                 token=token,
                 confirmations=confirmations,
                 status=status,
-                block_number=tx.slot if hasattr(tx, "slot") else None,
-                timestamp=tx.block_time if hasattr(tx, "block_time") else None,
+                block_number=tx.slot,
+                timestamp=tx.block_time,
             )
 
         except Exception as e:
-            logger.error(f"Failed to get transaction {tx_hash}: {e}")
+            logger.error("Failed to get transaction %s: %s", tx_hash, e)
             return None
 
     async def get_transaction_confirmations(self, tx_hash: str) -> int:
         """Get transaction confirmation count."""
         try:
-            from solders.signature import Signature
-
-            signature = Signature.from_string(tx_hash)
+            signature = _parse_signature(tx_hash)
 
             # Get transaction status
             response = await self._client.get_signature_statuses([signature])
@@ -384,7 +403,7 @@ class SolanaService(BlockchainService):
             return 0
 
         except Exception as e:
-            logger.error(f"Failed to get confirmations for {tx_hash}: {e}")
+            logger.error("Failed to get confirmations for %s: %s", tx_hash, e)
             return 0
 
     async def close(self):
@@ -3,10 +3,14 @@
 Provides TRON-specific blockchain operations using tronpy library.
 """
 
+import asyncio
 import logging
 from decimal import Decimal
+from typing import Any
 
+import base58
 from tronpy import AsyncTron
+from tronpy.async_contract import AsyncContract
 from tronpy.keys import PrivateKey
 from tronpy.providers.async_http import AsyncHTTPProvider
 
@@ -22,6 +26,16 @@ from src.core.config import get_settings
 logger = logging.getLogger(__name__)
 
 
+def _generate_wallet_sync() -> WalletInfo:
+    """Generate a TRON key pair (blocking)."""
+    priv_key = PrivateKey.random()
+    address = priv_key.public_key.to_base58check_address()
+    return WalletInfo(
+        address=address,
+        private_key=priv_key.hex(),
+    )
+
+
 class TronService(BlockchainService):
     """TRON blockchain service implementation.
 
@@ -32,11 +46,15 @@ class TronService(BlockchainService):
     # TRC-20 transfer function selector
     TRC20_TRANSFER_SELECTOR = "a9059cbb"
 
+    # 1 TRX = 1,000,000 SUN
+    TRX_DECIMALS = 6
+
     def __init__(self):
         """Initialize TRON service with network configuration."""
         settings = get_settings()
         self._network = settings.tron_network
         self._api_key = settings.tron_api_key
+        self._fee_limit = settings.tron_send_fee_limit
 
         # Initialize client based on network
         if self._network == "mainnet":
@@ -50,6 +68,9 @@ class TronService(BlockchainService):
         else:  # nile
             self._client = AsyncTron(network="nile")
 
+        # Contract handles keyed by address (ABI is fetched once per process)
+        self._contracts: dict[str, AsyncContract] = {}
+
     @property
     def chain_code(self) -> str:
         return "TRON"
@@ -61,41 +82,43 @@ class TronService(BlockchainService):
     # ============ Wallet Operations ============
 
     async def generate_wallet(self) -> WalletInfo:
-        """Generate a new TRON wallet."""
-        priv_key = PrivateKey.random()
-        address = priv_key.public_key.to_base58check_address()
-        return WalletInfo(
-            address=address,
-            private_key=priv_key.hex(),
-        )
+        """Generate a new TRON wallet.
+
+        secp256k1 key derivation is CPU-bound, so it runs in a worker thread
+        to keep the event loop free during signup bursts.
+        """
+        return await asyncio.to_thread(_generate_wallet_sync)
 
     def validate_address(self, address: str) -> bool:
-        """Validate TRON address format."""
-        if not address:
-            return False
+        """Validate TRON address format (local base58check, no RPC)."""
         # TRON addresses start with 'T' and are 34 characters
-        if not address.startswith("T"):
-            return False
-        if len(address) != 34:
+        if not address or len(address) != 34 or address[0] != "T":
             return False
-        # Basic base58 check
         try:
-            import base58
-
-            base58.b58decode_check(address)
-            return True
-        except Exception:
+            raw = base58.b58decode_check(address)
+        except ValueError:
             return False
+        # 0x41 network prefix + 20-byte account id
+        return len(raw) == 21 and raw[0] == 0x41
+
+    async def _get_contract(self, contract_address: str) -> AsyncContract:
+        """Get a cached contract handle, fetching its ABI on first use."""
+        contract = self._contracts.get(contract_address)
+        if contract is None:
+            contract = await self._client.get_contract(contract_address)
+            self._contracts[contract_address] = contract
+        return contract
 
     # ============ Balance Operations ============
 
     async def get_native_balance(self, address: str) -> Decimal:
         """Get TRX balance."""
         try:
-            balance_sun = await self._client.get_account_balance(address)
-            return Decimal(str(balance_sun))
+            # tronpy already returns a Decimal in TRX; avoid the str() round-trip
+            balance = await self._client.get_account_balance(address)
+            return Decimal(balance)
         except Exception as e:
-            logger.error(f"Failed to get TRX balance for {address}: {e}")
+            logger.error("Failed to get TRX balance for %s: %s", address, e)
             return Decimal("0")
 
     async def get_token_balance(
@@ -106,12 +129,15 @@ class TronService(BlockchainService):
     ) -> Decimal:
         """Get TRC-20 token balance."""
         try:
-            contract = await self._client.get_contract(contract_address)
+            contract = await self._get_contract(contract_address)
             balance = await contract.functions.balanceOf(address)
             return self.from_smallest_unit(balance, decimals)
         except Exception as e:
             logger.error(
-                f"Failed to get token balance for {address} (contract: {contract_address}): {e}"
+                "Failed to get token balance for %s (contract: %s): %s",
+                address,
+                contract_address,
+                e,
             )
             return Decimal("0")
 
@@ -128,22 +154,19 @@ class TronService(BlockchainService):
             priv_key = PrivateKey(bytes.fromhex(from_private_key))
             from_address = priv_key.public_key.to_base58check_address()
 
-            # Amount in SUN (1 TRX = 1,000,000 SUN)
-            amount_sun = self.to_smallest_unit(amount, 6)
+            # Amount in SUN
+            amount_sun = self.to_smallest_unit(amount, self.TRX_DECIMALS)
 
-            # Build and sign transaction
-            txn = (
-                self._client.trx.transfer(from_address, to_address, amount_sun)
-                .build()
-                .sign(priv_key)
-            )
+            # Build (async RPC for ref block) and sign transaction
+            txn = await self._client.trx.transfer(from_address, to_address, amount_sun).build()
+            txn = txn.sign(priv_key)
 
             # Broadcast
             result = await txn.broadcast()
 
             if result.get("result"):
                 tx_hash = result.get("txid")
-                logger.info(f"TRX transfer successful: {tx_hash}")
+                logger.info("TRX transfer successful: %s", tx_hash)
                 return TransactionResult(
                     success=True,
                     tx_hash=tx_hash,
@@ -151,7 +174,7 @@ class TronService(BlockchainService):
                 )
             else:
                 error_msg = result.get("message", "Unknown error")
-                logger.error(f"TRX transfer failed: {error_msg}")
+                logger.error("TRX transfer failed: %s", error_msg)
                 return TransactionResult(
                     success=False,
                     error=error_msg,
@@ -180,23 +203,25 @@ class TronService(BlockchainService):
             from_address = priv_key.public_key.to_base58check_address()
 
             # Get contract
-            contract = await self._client.get_contract(contract_address)
+            contract = await self._get_contract(contract_address)
 
             # Amount in smallest unit
             amount_smallest = self.to_smallest_unit(amount, decimals)
 
-            # Build transfer transaction
+            # Build transfer transaction. build() fetches a fresh ref block
+            # per transfer; that one header round-trip is small next to the
+            # trigger/broadcast calls, and sends here are one-off, not batched
             txn = await contract.functions.transfer.with_owner(from_address)(
                 to_address, amount_smallest
             )
-            txn = txn.build().sign(priv_key)
+            txn = (await txn.fee_limit(self._fee_limit).build()).sign(priv_key)
 
             # Broadcast
             result = await txn.broadcast()
 
             if result.get("result"):
                 tx_hash = result.get("txid")
-                logger.info(f"TRC-20 transfer successful: {tx_hash}")
+                logger.info("TRC-20 transfer successful: %s", tx_hash)
                 return TransactionResult(
                     success=True,
                     tx_hash=tx_hash,
@@ -204,7 +229,7 @@ class TronService(BlockchainService):
                 )
             else:
                 error_msg = result.get("message", "Unknown error")
-                logger.error(f"TRC-20 transfer failed: {error_msg}")
+                logger.error("TRC-20 transfer failed: %s", error_msg)
                 return TransactionResult(
                     success=False,
                     error=error_msg,
@@ -221,72 +246,123 @@ class TronService(BlockchainService):
 
     # ============ Transaction Query ============
 
+    async def get_latest_block_number(self) -> int:
+        """Get the latest block number."""
+        return await self._client.get_latest_block_number()
+
     async def get_transaction(self, tx_hash: str) -> TransactionInfo | None:
         """Get transaction details."""
         try:
-            tx_info = await self._client.get_transaction_info(tx_hash)
-            if not tx_info:
-                return None
+            # Receipt, raw transaction and chain head are independent reads
+            tx_info, tx, latest_block = await asyncio.gather(
+                self._client.get_transaction_info(tx_hash),
+                self._client.get_transaction(tx_hash),
+                self.get_latest_block_number(),
+            )
+            return self._parse_transaction(tx_hash, tx_info, tx, latest_block)
 
-            tx = await self._client.get_transaction(tx_hash)
-            if not tx:
-                return None
+        except Exception as e:
+            logger.error("Failed to get transaction %s: %s", tx_hash, e)
+            return None
 
-            # Parse transaction data
-            contract_data = tx.get("raw_data", {}).get("contract", [{}])[0]
-            contract_type = contract_data.get("type")
-
-            from_address = ""
-            to_address = ""
-            amount = Decimal("0")
-            token = "TRX"
-
-            if contract_type == "TransferContract":
-                # Native TRX transfer
-                value = contract_data.get("parameter", {}).get("value", {})
-                from_address = value.get("owner_address", "")
-                to_address = value.get("to_address", "")
-                amount = self.from_smallest_unit(value.get("amount", 0), 6)
-            elif contract_type == "TriggerSmartContract":
-                # Token transfer
-                value = contract_data.get("parameter", {}).get("value", {})
-                from_address = value.get("owner_address", "")
-                # Parse TRC-20 transfer data
-                data = value.get("data", "")
-                if data.startswith(self.TRC20_TRANSFER_SELECTOR):
-                    token = "TOKEN"  # Generic, actual symbol needs lookup
-
-            # Determine status
-            result = tx_info.get("receipt", {}).get("result")
-            if result == "SUCCESS":
-                status = TransactionStatus.CONFIRMED
-            elif result:
-                status = TransactionStatus.FAILED
-            else:
-                status = TransactionStatus.PENDING
-
-            confirmations = await self.get_transaction_confirmations(tx_hash)
-
-            return TransactionInfo(
-                tx_hash=tx_hash,
-                from_address=from_address,
-                to_address=to_address,
-                amount=amount,
-                token=token,
-                confirmations=confirmations,
-                status=status,
-                block_number=tx_info.get("blockNumber"),
-                timestamp=tx_info.get("blockTimeStamp"),
-            )
+    async def get_transactions(self, tx_hashes: list[str]) -> dict[str, TransactionInfo | None]:
+        """Get details for many transactions concurrently.
 
+        The chain head is fetched once and shared by every lookup, so polling
+        N pending transactions costs about one round-trip instead of 3N.
+
+        Args:
+            tx_hashes: Transaction hashes
+
+        Returns:
+            Mapping of tx_hash to TransactionInfo (None if not found or failed)
+        """
+        try:
+            latest_block = await self.get_latest_block_number()
         except Exception as e:
-            logger.error(f"Failed to get transaction {tx_hash}: {e}")
+            logger.error("Failed to get latest block: %s", e)
+            return dict.fromkeys(tx_hashes)
+
+        async def fetch(tx_hash: str) -> TransactionInfo | None:
+            try:
+                tx_info, tx = await asyncio.gather(
+                    self._client.get_transaction_info(tx_hash),
+                    self._client.get_transaction(tx_hash),
+                )
+                return self._parse_transaction(tx_hash, tx_info, tx, latest_block)
+            except Exception as e:
+                logger.error("Failed to get transaction %s: %s", tx_hash, e)
+                return None
+
+        results = await asyncio.gather(*(fetch(tx_hash) for tx_hash in tx_hashes))
+        return dict(zip(tx_hashes, results, strict=True))
+
+    def _parse_transaction(
+        self,
+        tx_hash: str,
+        tx_info: dict[str, Any],
+        tx: dict[str, Any],
+        latest_block: int,
+    ) -> TransactionInfo | None:
+        """Build TransactionInfo from raw tronpy responses."""
+        if not tx_info or not tx:
             return None
 
+        # Parse transaction data
+        contract_data = tx.get("raw_data", {}).get("contract", [{}])[0]
+        contract_type = contract_data.get("type")
+
+        from_address = ""
+        to_address = ""
+        amount = Decimal("0")
+        token = "TRX"
+
+        if contract_type == "TransferContract":
+            # Native TRX transfer
+            value = contract_data.get("parameter", {}).get("value", {})
+            from_address = value.get("owner_address", "")
+            to_address = value.get("to_address", "")
+            amount = self.from_smallest_unit(value.get("amount", 0), self.TRX_DECIMALS)
+        elif contract_type == "TriggerSmartContract":
+            # Token transfer
+            value = contract_data.get("parameter", {}).get("value", {})
+            from_address = value.get("owner_address", "")
+            # Parse TRC-20 transfer data
+            data = value.get("data", "")
+            if data.startswith(self.TRC20_TRANSFER_SELECTOR):
+                token = "TOKEN"  # Generic, actual symbol needs lookup
+
+        # Determine status
+        result = tx_info.get("receipt", {}).get("result")
+        if result == "SUCCESS":
+            status = TransactionStatus.CONFIRMED
+        elif result:
+            status = TransactionStatus.FAILED
+        else:
+            status = TransactionStatus.PENDING
+
+        tx_block = tx_info.get("blockNumber")
+        confirmations = max(0, latest_block - tx_block) if tx_block else 0
+
+        return TransactionInfo(
+            tx_hash=tx_hash,
+            from_address=from_address,
+            to_address=to_address,
+            amount=amount,
+            token=token,
+            confirmations=confirmations,
+            status=status,
+            block_number=tx_block,
+            timestamp=tx_info.get("blockTimeStamp"),
+        )
+
     async def get_transaction_confirmations(self, tx_hash: str) -> int:
         """Get transaction confirmation count."""
         try:
-            tx_info = await self._client.get_transaction_info(tx_hash)
+            tx_info, latest_block = await asyncio.gather(
+                self._client.get_transaction_info(tx_hash),
+                self.get_latest_block_number(),
+            )
             if not tx_info:
                 return 0
 
@@ -294,12 +370,11 @@ class TronService(BlockchainService):
             if not tx_block:
                 return 0
 
-            latest_block = await self.get_latest_block_number()
             confirmations = latest_block - tx_block
             return max(0, confirmations)
 
         except Exception as e:
-            logger.error(f"Failed to get confirmations for {tx_hash}: {e}")
+            logger.error("Failed to get confirmations for %s: %s", tx_hash, e)
             return 0
 
     async def close(self):
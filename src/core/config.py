@@ -1,6 +1,6 @@
 """AKX Crypto Payment Gateway - Core Configuration."""
 
-from functools import lru_cache
+from functools import cached_property
 from typing import Literal
 
 from pydantic import Field, MySQLDsn
@@ -26,6 +26,9 @@ class Settings(BaseSettings):
 
     # Database
     database_url: MySQLDsn = Field(..., description="MySQL connection string with aiomysql driver")
+    db_pool_size: int = Field(
+        default=25, description="Persistent connections per process (overflow is half of this)"
+    )
 
     # Security
     aes_encryption_key: str = Field(
@@ -53,6 +56,14 @@ class Settings(BaseSettings):
     tron_network: Literal["mainnet", "shasta", "nile"] = Field(
         default="mainnet", description="TRON network"
     )
+    tron_fee_limit: int = Field(
+        default=30_000_000,
+        description="Max fee in SUN for sweep/withdrawal TRC20 transfers (30 TRX, was 100)",
+    )
+    tron_send_fee_limit: int = Field(
+        default=10_000_000,
+        description="Max fee in SUN for BlockchainService TRC20 sends (10 TRX, tronpy's default)",
+    )
 
     # Ethereum
     eth_rpc_url: str = Field(default="", description="Ethereum RPC endpoint")
@@ -68,6 +79,9 @@ class Settings(BaseSettings):
         default="redis://localhost:6379",
         description="Redis connection URL for task queue",
     )
+    redis_max_connections: int = Field(
+        default=64, description="Maximum connections in the Redis connection pool"
+    )
 
     # Webhook secrets (optional, for signature verification)
     alchemy_webhook_secret: str = Field(default="", description="Alchemy webhook signing key")
@@ -84,8 +98,19 @@ class Settings(BaseSettings):
         default=5, description="API request timestamp validity window in minutes"
     )
 
+    @cached_property
+    def allowed_origins_list(self) -> tuple[str, ...]:
+        """Parsed CORS origins (split once per process)."""
+        return tuple(o for o in map(str.strip, self.allowed_origins.split(",")) if o)
+
+
+# Singleton settings instance (initialized on first use)
+_settings: Settings | None = None
+
 
-@lru_cache
 def get_settings() -> Settings:
     """Get cached application settings."""
-    return Settings()  # type: ignore[call-arg]
+    global _settings
+    if _settings is None:
+        _settings = Settings()  # type: ignore[call-arg]
+    return _settings
@@ -1,5 +1,6 @@
 """AKX Crypto Payment Gateway - Custom exceptions."""
 
+from decimal import Decimal
 from typing import Any
 
 
@@ -35,8 +36,8 @@ class InsufficientBalanceError(AKXError):
 
     def __init__(
         self,
-        required: "Decimal | None" = None,
-        available: "Decimal | None" = None,
+        required: Decimal | None = None,
+        available: Decimal | None = None,
         message: str = "积分余额不足",
     ) -> None:
         details = {}
@@ -47,9 +48,6 @@ class InsufficientBalanceError(AKXError):
         super().__init__(message, details)
 
 
-from decimal import Decimal  # noqa: E402 - 为避免循环导入放在下面
-
-
 class ChainError(AKXError):
     """Blockchain interaction error."""
 
@@ -1,6 +1,7 @@
 """Redis connection management for AKX Payment Gateway."""
 
 import redis.asyncio as redis
+from redis.asyncio.client import Pipeline
 
 from src.core.config import get_settings
 
@@ -19,6 +20,11 @@ async def init_redis() -> None:
         settings.redis_url,
         encoding="utf-8",
         decode_responses=True,
+        max_connections=settings.redis_max_connections,
+        socket_keepalive=True,
+        socket_timeout=2.0,
+        health_check_interval=30,
+        retry_on_timeout=True,
     )
 
 
@@ -45,3 +51,23 @@ def get_redis() -> redis.Redis:
     if _redis_pool is None:
         raise RuntimeError("Redis not initialized. Call init_redis() during application startup.")
     return _redis_pool
+
+
+def get_redis_pipeline(transaction: bool = False) -> Pipeline:
+    """Get a Redis pipeline for batching commands into one round-trip.
+
+    Usage:
+        async with get_redis_pipeline() as pipe:
+            pipe.incr(key).expire(key, ttl)
+            counter, _ = await pipe.execute()
+
+    Args:
+        transaction: Wrap the batch in MULTI/EXEC
+
+    Returns:
+        Pipeline bound to the shared connection pool
+
+    Raises:
+        RuntimeError: If Redis is not initialized
+    """
+    return get_redis().pipeline(transaction=transaction)
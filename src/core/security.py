@@ -1,14 +1,20 @@
 """AKX Crypto Payment Gateway - Security utilities for AES encryption."""
 
 import base64
+import itertools
+import logging
+import os
 import secrets
 from typing import TYPE_CHECKING
 
+from cryptography.hazmat.backends.openssl.backend import backend as openssl_backend
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
 if TYPE_CHECKING:
     pass
 
+logger = logging.getLogger(__name__)
+
 
 class AESCipher:
     """AES-256-GCM encryption for sensitive data like private keys.
@@ -19,12 +25,14 @@ class AESCipher:
         decrypted = cipher.decrypt(encrypted)
 
     The encrypted output format: base64(nonce + ciphertext + tag)
-    - nonce: 12 bytes
+    - nonce: 12 bytes (4-byte random per-instance prefix + 8-byte counter)
     - ciphertext: variable length
     - tag: 16 bytes (appended by AESGCM)
     """
 
     NONCE_SIZE = 12  # 96 bits recommended for GCM
+    NONCE_PREFIX_SIZE = 4
+    _COUNTER_MASK = (1 << 64) - 1
 
     def __init__(self, key_base64: str) -> None:
         """Initialize with base64-encoded 32-byte key.
@@ -36,6 +44,50 @@ class AESCipher:
         if len(key) != 32:
             raise ValueError("AES key must be exactly 32 bytes (256 bits)")
         self._aesgcm = AESGCM(key)
+        self.reseed_nonce()
+
+    def reseed_nonce(self) -> None:
+        """Draw a fresh random nonce prefix and counter start.
+
+        Deterministic nonce construction (NIST SP 800-38D 8.2.1): a random fixed
+        field per instance plus a randomly seeded invocation counter, so encrypt
+        does not need a getrandom() call per message. Must be re-run in forked
+        children, which would otherwise continue the parent's nonce sequence.
+        """
+        self._nonce_prefix = secrets.token_bytes(self.NONCE_PREFIX_SIZE)
+        self._nonce_counter = itertools.count(secrets.randbits(64))
+
+    def _next_nonce(self) -> bytes:
+        """Return the next unique 96-bit nonce for this key."""
+        counter = next(self._nonce_counter) & self._COUNTER_MASK
+        return self._nonce_prefix + counter.to_bytes(8, "big")
+
+    def encrypt_bytes(self, plaintext: bytes) -> bytes:
+        """Encrypt raw bytes without base64 framing.
+
+        Args:
+            plaintext: The bytes to encrypt
+
+        Returns:
+            nonce + ciphertext + tag
+        """
+        nonce = self._next_nonce()
+        return b"".join((nonce, self._aesgcm.encrypt(nonce, plaintext, None)))
+
+    def decrypt_bytes(self, data: bytes) -> bytes:
+        """Decrypt raw bytes produced by encrypt_bytes().
+
+        Args:
+            data: nonce + ciphertext + tag
+
+        Returns:
+            Original plaintext bytes
+
+        Raises:
+            cryptography.exceptions.InvalidTag: If tampering detected
+        """
+        view = memoryview(data)
+        return self._aesgcm.decrypt(view[: self.NONCE_SIZE], view[self.NONCE_SIZE :], None)
 
     def encrypt(self, plaintext: str) -> str:
         """Encrypt plaintext string to base64-encoded ciphertext.
@@ -46,10 +98,7 @@ class AESCipher:
         Returns:
             Base64-encoded string containing nonce + ciphertext + tag
         """
-        nonce = secrets.token_bytes(self.NONCE_SIZE)
-        ciphertext = self._aesgcm.encrypt(nonce, plaintext.encode("utf-8"), None)
-        # Output: nonce (12) + ciphertext + tag (16)
-        return base64.b64encode(nonce + ciphertext).decode("ascii")
+        return base64.b64encode(self.encrypt_bytes(plaintext.encode("utf-8"))).decode("ascii")
 
     def decrypt(self, encrypted_b64: str) -> str:
         """Decrypt base64-encoded ciphertext to plaintext string.
@@ -63,11 +112,7 @@ class AESCipher:
         Raises:
             cryptography.exceptions.InvalidTag: If tampering detected
         """
-        data = base64.b64decode(encrypted_b64)
-        nonce = data[: self.NONCE_SIZE]
-        ciphertext = data[self.NONCE_SIZE :]
-        plaintext = self._aesgcm.decrypt(nonce, ciphertext, None)
-        return plaintext.decode("utf-8")
+        return self.decrypt_bytes(base64.b64decode(encrypted_b64)).decode("utf-8")
 
 
 def generate_aes_key() -> str:
@@ -81,6 +126,34 @@ def generate_aes_key() -> str:
     return base64.b64encode(secrets.token_bytes(32)).decode("ascii")
 
 
+def _cpu_has_aes_instructions() -> bool | None:
+    """Check whether the CPU advertises hardware AES (AES-NI / ARMv8 AES).
+
+    Returns:
+        True/False from /proc/cpuinfo, or None if it cannot be determined
+    """
+    try:
+        with open("/proc/cpuinfo", encoding="ascii", errors="ignore") as f:
+            for line in f:
+                key, _, value = line.partition(":")
+                if key.strip() in ("flags", "Features"):
+                    return "aes" in value.split()
+    except OSError:
+        return None
+    return None
+
+
+def check_aes_backend() -> None:
+    """Log the OpenSSL build backing AESGCM and warn if hardware AES is missing.
+
+    AES-GCM in OpenSSL uses AES-NI + PCLMULQDQ (or ARMv8 crypto extensions)
+    when available; without them every key decrypt runs in software.
+    """
+    logger.info("AES-GCM backend: %s", openssl_backend.openssl_version_text())
+    if _cpu_has_aes_instructions() is False:
+        logger.warning("CPU does not report hardware AES support; AES-GCM will run in software")
+
+
 # Singleton cipher instance (initialized on first use)
 _cipher: AESCipher | None = None
 
@@ -94,10 +167,24 @@ def get_cipher() -> AESCipher:
     if _cipher is None:
         from src.core.config import get_settings
 
+        check_aes_backend()
         _cipher = AESCipher(get_settings().aes_encryption_key)
     return _cipher
 
 
+def _reseed_cipher_after_fork() -> None:
+    """Give a forked child (Celery prefork, gunicorn --preload) its own nonces.
+
+    A cipher built before fork would otherwise hand every child the same
+    (prefix, counter) pair, reusing GCM nonces under one key.
+    """
+    if _cipher is not None:
+        _cipher.reseed_nonce()
+
+
+os.register_at_fork(after_in_child=_reseed_cipher_after_fork)
+
+
 def encrypt_private_key(private_key: str) -> str:
     """Encrypt a private key for database storage.
 
@@ -3,25 +3,33 @@
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from src.core.config import get_settings
 
-# Create async engine
-# Note: pool_pre_ping helps detect stale connections
+# Pin every connection to UTC: NOW()/CURRENT_TIMESTAMP server defaults must
+# agree with the UTC datetimes the application writes and reads back
+MYSQL_CONNECT_ARGS = {"init_command": "SET time_zone = '+00:00'"}
+
+# Create async engine (one per process, shared by every session)
+# Note: pool_pre_ping helps detect stale connections; pool_recycle stays below
+# MySQL's wait_timeout and LIFO keeps the most recently used connections hot
+_settings = get_settings()
 engine = create_async_engine(
-    str(get_settings().database_url),
-    echo=get_settings().debug,
+    str(_settings.database_url),
+    echo=_settings.debug,
     pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
+    pool_size=_settings.db_pool_size,
+    max_overflow=_settings.db_pool_size // 2,
+    pool_timeout=5,
+    pool_recycle=1800,
+    pool_use_lifo=True,
+    connect_args=MYSQL_CONNECT_ARGS,
 )
 
 # Async session factory
-async_session_factory = sessionmaker(
+async_session_factory = async_sessionmaker(
     engine,
-    class_=AsyncSession,
     expire_on_commit=False,
 )
 
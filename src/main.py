@@ -1,32 +1,74 @@
 """AKX Crypto Payment Gateway - FastAPI Application."""
 
+import asyncio
+import contextlib
+import logging
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from pathlib import Path
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
-from fastapi_pagination import add_pagination
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import text
 
 from src.api import register_routers
 from src.core.config import get_settings
-from src.core.redis import close_redis, init_redis
-from src.db import close_db
+from src.core.redis import close_redis, get_redis, init_redis
+from src.db import close_db, engine
 
 # Base directory for static files
 BASE_DIR = Path(__file__).resolve().parent
 
+logger = logging.getLogger(__name__)
+
+# Liveness probes are polled constantly; serialize the body once
+_HEALTH_PAYLOAD = ORJSONResponse({"status": "healthy"}).body
+
+# Backoff between startup warm-up attempts (seconds)
+_WARMUP_INITIAL_DELAY = 1.0
+_WARMUP_MAX_DELAY = 30.0
+
+
+async def _deferred_init(app: FastAPI) -> None:
+    """Warm the database and Redis pools, then mark the app ready.
+
+    Runs after the server starts accepting connections so that slow backends
+    delay readiness instead of blocking the listening socket. Failed attempts
+    are retried with exponential backoff; the app stays not-ready (503 on
+    /health/ready) until both backends answer.
+    """
+    delay = _WARMUP_INITIAL_DELAY
+    while True:
+        try:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+            await get_redis().ping()
+        except Exception as e:
+            logger.warning("Startup warm-up failed, retrying in %.0fs: %s", delay, e)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, _WARMUP_MAX_DELAY)
+            continue
+
+        app.state.ready.set()
+        return
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan handler.
 
-    Startup: Initialize Redis connection pool
+    Startup: Initialize Redis connection pool, warm pools in the background
     Shutdown: Close database and Redis connections
     """
     await init_redis()
+    app.state.ready = asyncio.Event()
+    app.state.init_task = asyncio.create_task(_deferred_init(app))
     yield
+    # Warm-up may still be retrying against an unreachable backend
+    app.state.init_task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await app.state.init_task
     await close_redis()
     await close_db()
 
@@ -45,15 +87,12 @@ def create_app() -> FastAPI:
         version="0.1.0",
         docs_url="/docs",
         redoc_url="/redoc",
+        default_response_class=ORJSONResponse,
         lifespan=lifespan,
     )
 
     # CORS middleware
-    allowed_origins = (
-        ["*"]
-        if settings.debug
-        else [o.strip() for o in settings.allowed_origins.split(",") if o.strip()]
-    )
+    allowed_origins = ("*",) if settings.debug else settings.allowed_origins_list
     app.add_middleware(
         CORSMiddleware,
         allow_origins=allowed_origins,
@@ -65,16 +104,34 @@ def create_app() -> FastAPI:
     # Register all API routers
     register_routers(app)
 
-    # Add pagination support
-    add_pagination(app)
+    # Static files, served by a StaticFiles instance created on first request
+    @app.api_route("/static/{path:path}", methods=["GET", "HEAD"], include_in_schema=False)
+    async def static_files(path: str, request: Request) -> Response:
+        """Serve files under src/static."""
+        static = getattr(request.app.state, "static", None)
+        if static is None:
+            from starlette.staticfiles import StaticFiles
 
-    # Mount static files
-    app.mount("/static", StaticFiles(directory=str(BASE_DIR / "static")), name="static")
+            static = StaticFiles(directory=str(BASE_DIR / "static"))
+            request.app.state.static = static
+        return await static.get_response(path, request.scope)
 
     @app.get("/health")
-    async def health_check() -> dict[str, str]:
-        """Health check endpoint."""
-        return {"status": "healthy"}
+    @app.get("/health/live")
+    async def health_check() -> Response:
+        """Liveness check endpoint."""
+        return Response(content=_HEALTH_PAYLOAD, media_type="application/json")
+
+    @app.get("/health/ready")
+    async def readiness_check(request: Request) -> ORJSONResponse:
+        """Readiness check endpoint, 503 until startup warm-up completes."""
+        if not request.app.state.ready.is_set():
+            return ORJSONResponse({"status": "starting"}, status_code=503)
+        return ORJSONResponse({"status": "ready"})
+
+    # Build the middleware stack once, now that all middleware is registered;
+    # any later add_middleware() call fails loudly instead of rebuilding it
+    app.middleware_stack = app.build_middleware_stack()
 
     return app
 
@@ -20,13 +20,7 @@ from src.models.recharge import (
 )
 from src.models.token import Token, TokenChainSupport
 from src.models.user import User, UserRole
-from src.models.wallet import (
-    ChainEnum,  # DEPRECATED
-    TokenEnum,  # DEPRECATED
-    Wallet,
-    WalletType,
-    get_payment_method_expiry_deprecated,  # DEPRECATED
-)
+from src.models.wallet import Wallet, WalletType
 from src.models.webhook_provider import (
     WebhookProvider,
     WebhookProviderChain,
@@ -73,8 +67,4 @@ __all__ = [
     "WebhookProvider",
     "WebhookProviderChain",
     "WebhookProviderType",
-    # DEPRECATED - kept for backward compatibility
-    "ChainEnum",
-    "TokenEnum",
-    "get_payment_method_expiry_deprecated",
 ]
@@ -0,0 +1,33 @@
+"""AKX Crypto Payment Gateway - Shared SQLModel base."""
+
+import os
+
+import sqlalchemy as sa
+from pydantic import ConfigDict
+from sqlmodel import SQLModel
+
+
+class AKXModel(SQLModel):
+    """Base class for AKX table models.
+
+    Pydantic core schemas are built on first validation/serialization rather
+    than at import, which keeps startup of workers and scripts cheap. Set
+    ``AKX_EAGER_BUILD=1`` to build them at import (e.g. for production warm-up).
+    """
+
+    model_config = ConfigDict(defer_build=os.environ.get("AKX_EAGER_BUILD") != "1")
+
+
+def updated_at_column() -> sa.Column:
+    """Build an ``updated_at`` column maintained by MySQL itself.
+
+    ``ON UPDATE CURRENT_TIMESTAMP`` stamps the row on every UPDATE, including
+    bulk Core updates, so the ORM never sends the value; ``FetchedValue``
+    tells it to reload the column after a flush instead.
+    """
+    return sa.Column(
+        sa.DateTime,
+        server_default=sa.text("CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP"),
+        server_onupdate=sa.FetchedValue(),
+        nullable=False,
+    )
@@ -3,14 +3,30 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlmodel import Field, Relationship, SQLModel
+import sqlalchemy as sa
+from pydantic import ConfigDict
+from sqlmodel import Field, Relationship
+
+from src.models._base import AKXModel, updated_at_column
 
 if TYPE_CHECKING:
     from src.models.token import TokenChainSupport
     from src.models.webhook_provider import WebhookProviderChain
 
+# OpenAPI example for Chain, shared by reference rather than rebuilt per schema
+_CHAIN_EXAMPLE = {
+    "code": "TRON",
+    "name": "TRON",
+    "description": "High-throughput blockchain supporting TRC-20 tokens",
+    "is_enabled": True,
+    "sort_order": 1,
+    "explorer_url": "https://tronscan.org",
+    "native_token": "TRX",
+    "confirmation_blocks": 19,
+}
+
 
-class Chain(SQLModel, table=True):
+class Chain(AKXModel, table=True):
     """Blockchain network configuration.
 
     Manages supported blockchain networks independently from tokens.
@@ -47,25 +63,17 @@ class Chain(SQLModel, table=True):
     native_token: str | None = Field(default=None, max_length=20, description="Native token symbol")
     confirmation_blocks: int = Field(default=1, description="Required confirmations")
 
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(
+        default=None,
+        sa_column=sa.Column(sa.DateTime, server_default=sa.func.now(), nullable=False),
+    )
+    updated_at: datetime = Field(
+        default=None,
+        sa_column=updated_at_column(),
+    )
 
     # Relationships
     token_supports: list["TokenChainSupport"] = Relationship(back_populates="chain")
     webhook_providers: list["WebhookProviderChain"] = Relationship(back_populates="chain")
 
-    class Config:
-        """Pydantic configuration."""
-
-        json_schema_extra = {
-            "example": {
-                "code": "TRON",
-                "name": "TRON",
-                "description": "High-throughput blockchain supporting TRC-20 tokens",
-                "is_enabled": True,
-                "sort_order": 1,
-                "explorer_url": "https://tronscan.org",
-                "native_token": "TRX",
-                "confirmation_blocks": 19,
-            }
-        }
+    model_config = ConfigDict(json_schema_extra={"example": _CHAIN_EXAMPLE})
@@ -7,17 +7,19 @@ This module defines:
 
 from datetime import datetime
 from decimal import Decimal
-from enum import Enum
+from enum import StrEnum
 from typing import TYPE_CHECKING, Optional
 
 import sqlalchemy as sa
-from sqlmodel import Field, Relationship, SQLModel
+from sqlmodel import Field, Relationship
+
+from src.models._base import AKXModel, updated_at_column
 
 if TYPE_CHECKING:
     from src.models.user import User
 
 
-class ExchangeRateMode(str, Enum):
+class ExchangeRateMode(StrEnum):
     """Merchant exchange rate mode."""
 
     SYSTEM = "system"  # 使用系统汇率
@@ -25,7 +27,7 @@ class ExchangeRateMode(str, Enum):
     CUSTOM = "custom"  # 完全自定义汇率
 
 
-class ExchangeRateSource(SQLModel, table=True):
+class ExchangeRateSource(AKXModel, table=True):
     """System exchange rate source configuration.
 
     Managed by super admin. Defines where to fetch exchange rates from.
@@ -84,12 +86,13 @@ class ExchangeRateSource(SQLModel, table=True):
     )
     is_enabled: bool = Field(default=True, description="Whether source is active")
     created_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default=None,
+        sa_column=sa.Column(sa.DateTime, server_default=sa.func.now(), nullable=False),
         description="Creation timestamp",
     )
     updated_at: datetime = Field(
-        default_factory=datetime.utcnow,
-        sa_column_kwargs={"onupdate": datetime.utcnow},
+        default=None,
+        sa_column=updated_at_column(),
         description="Last update timestamp",
     )
 
@@ -99,7 +102,7 @@ class ExchangeRateSource(SQLModel, table=True):
     )
 
 
-class ExchangeRate(SQLModel, table=True):
+class ExchangeRate(AKXModel, table=True):
     """Merchant exchange rate configuration.
 
     Each merchant can customize their exchange rate behavior.
@@ -149,12 +152,13 @@ class ExchangeRate(SQLModel, table=True):
     )
     is_enabled: bool = Field(default=True, description="Whether config is active")
     created_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default=None,
+        sa_column=sa.Column(sa.DateTime, server_default=sa.func.now(), nullable=False),
         description="Creation timestamp",
     )
     updated_at: datetime = Field(
-        default_factory=datetime.utcnow,
-        sa_column_kwargs={"onupdate": datetime.utcnow},
+        default=None,
+        sa_column=updated_at_column(),
         description="Last update timestamp",
     )
 
@@ -5,13 +5,18 @@ from decimal import Decimal
 from typing import TYPE_CHECKING
 
 import sqlalchemy as sa
-from sqlmodel import Field, Relationship, SQLModel
+from sqlmodel import Field, Relationship
+
+from src.models._base import AKXModel, updated_at_column
 
 if TYPE_CHECKING:
     from src.models.user import User
 
+# Percent divisor, built once instead of parsing Decimal("100") per fee call
+_HUNDRED = Decimal("100")
+
 
-class FeeConfig(SQLModel, table=True):
+class FeeConfig(AKXModel, table=True):
     """Fee configuration for merchant transactions.
 
     Fee calculation:
@@ -44,16 +49,22 @@ class FeeConfig(SQLModel, table=True):
         sa_column=sa.Column(sa.DECIMAL(10, 4), nullable=False, default=Decimal("0.5")),
     )
     is_default: bool = Field(default=False)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(
+        default=None,
+        sa_column=sa.Column(sa.DateTime, server_default=sa.func.now(), nullable=False),
+    )
+    updated_at: datetime = Field(
+        default=None,
+        sa_column=updated_at_column(),
+    )
 
     # Relationships
     users: list["User"] = Relationship(back_populates="fee_config")
 
     def calculate_deposit_fee(self, amount: Decimal) -> Decimal:
         """Calculate deposit fee for given amount."""
-        return amount * self.deposit_fee_percent / Decimal("100")
+        return amount * self.deposit_fee_percent / _HUNDRED
 
     def calculate_withdraw_fee(self, amount: Decimal) -> Decimal:
         """Calculate withdrawal fee for given amount."""
-        return self.withdraw_fee_fixed + (amount * self.withdraw_fee_percent / Decimal("100"))
+        return self.withdraw_fee_fixed + (amount * self.withdraw_fee_percent / _HUNDRED)
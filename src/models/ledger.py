@@ -5,11 +5,13 @@ This module defines the Balance Ledger model for tracking all user balance chang
 
 from datetime import datetime
 from decimal import Decimal
-from enum import Enum
+from enum import StrEnum
 from typing import TYPE_CHECKING, Optional
 
 import sqlalchemy as sa
-from sqlmodel import Field, Relationship, SQLModel
+from sqlmodel import Field, Relationship
+
+from src.models._base import AKXModel
 
 if TYPE_CHECKING:
     from src.models.order import Order
@@ -21,7 +23,7 @@ if TYPE_CHECKING:
 # =============================================================================
 
 
-class BalanceChangeType(str, Enum):
+class BalanceChangeType(StrEnum):
     """Balance change type (账变类型)."""
 
     # 充值类
@@ -41,7 +43,7 @@ class BalanceChangeType(str, Enum):
     ADJUSTMENT = "adjustment"  # 调账
 
 
-class BalanceLedger(SQLModel, table=True):
+class BalanceLedger(AKXModel, table=True):
     """Balance ledger - tracks all balance changes for users.
 
     Records every balance change including:
@@ -51,6 +53,9 @@ class BalanceLedger(SQLModel, table=True):
     - Withdraw expense (提现支出)
     - Manual add/deduct (人工添加/扣除)
 
+    Writes are serialized per user: the users row is updated atomically or
+    locked FOR UPDATE in the same transaction that inserts the ledger row.
+
     Attributes:
         id: Auto-increment primary key
         user_id: User whose balance changed
@@ -71,12 +76,14 @@ class BalanceLedger(SQLModel, table=True):
     """
 
     __tablename__ = "balance_ledgers"
+    # Per-user ledger history (newest first) is served from one index range
+    __table_args__ = (sa.Index("ix_ledger_user_time", "user_id", sa.text("created_at DESC"), "id"),)
 
     id: int | None = Field(default=None, primary_key=True)
-    user_id: int = Field(foreign_key="users.id", index=True)
+    user_id: int = Field(foreign_key="users.id")
     order_id: int | None = Field(default=None, foreign_key="orders.id", index=True)
 
-    change_type: BalanceChangeType = Field(index=True, description="Type of balance change")
+    change_type: BalanceChangeType = Field(description="Type of balance change")
     amount: Decimal = Field(
         sa_column=sa.Column(sa.DECIMAL(32, 8), nullable=False),
         description="Change amount (positive=add, negative=deduct)",
@@ -115,9 +122,13 @@ class BalanceLedger(SQLModel, table=True):
         description="Admin who performed operation",
     )
 
-    created_at: datetime = Field(default_factory=datetime.utcnow, index=True)
+    created_at: datetime = Field(
+        default=None,
+        sa_column=sa.Column(sa.DateTime, server_default=sa.func.now(), nullable=False, index=True),
+    )
 
-    # Relationships
+    # Relationships - not loaded by default; queries that need them opt in
+    # with joinedload()/selectinload() (async sessions cannot lazy-load)
     user: Optional["User"] = Relationship(
         sa_relationship_kwargs={"foreign_keys": "[BalanceLedger.user_id]"}
     )
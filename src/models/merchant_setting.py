@@ -4,7 +4,9 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
 import sqlalchemy as sa
-from sqlmodel import Field, Relationship, SQLModel
+from sqlmodel import Field, Relationship
+
+from src.models._base import AKXModel, updated_at_column
 
 if TYPE_CHECKING:
     from src.models.user import User
@@ -18,7 +20,7 @@ class TelegramNotificationType(str):
     DEPOSIT_FAILED = "deposit_failed"  # 充值下单失败及原因
 
 
-class MerchantSetting(SQLModel, table=True):
+class MerchantSetting(AKXModel, table=True):
     """Merchant settings for payment and notification configuration.
 
     Each merchant can have customized settings for:
@@ -87,16 +89,15 @@ class MerchantSetting(SQLModel, table=True):
 
     # ============ Timestamps ============
     created_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default=None,
+        sa_column=sa.Column(sa.DateTime, server_default=sa.func.now(), nullable=False),
         description="Record creation time",
     )
     updated_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default=None,
+        sa_column=updated_at_column(),
         description="Record last update time",
     )
 
     # ============ Relationships ============
-    merchant: Optional["User"] = Relationship(
-        back_populates="merchant_setting",
-        sa_relationship_kwargs={"lazy": "selectin"},
-    )
+    merchant: Optional["User"] = Relationship(back_populates="merchant_setting")
@@ -4,24 +4,26 @@ import secrets
 import time
 from datetime import datetime
 from decimal import Decimal
-from enum import Enum
+from enum import StrEnum
 from typing import TYPE_CHECKING, Optional
 
 import sqlalchemy as sa
-from sqlmodel import Field, Relationship, SQLModel
+from sqlmodel import Field, Relationship
+
+from src.models._base import AKXModel, updated_at_column
 
 if TYPE_CHECKING:
     from src.models.user import User
 
 
-class OrderType(str, Enum):
+class OrderType(StrEnum):
     """Order type."""
 
     DEPOSIT = "deposit"
     WITHDRAW = "withdraw"
 
 
-class OrderStatus(str, Enum):
+class OrderStatus(StrEnum):
     """Order status.
 
     State transitions:
@@ -37,7 +39,11 @@ class OrderStatus(str, Enum):
     EXPIRED = "expired"  # 充值超时
 
 
-class CallbackStatus(str, Enum):
+# 终态：进入后写 completed_at 并释放金额尾数
+FINAL_ORDER_STATUSES = frozenset({OrderStatus.SUCCESS, OrderStatus.FAILED, OrderStatus.EXPIRED})
+
+
+class CallbackStatus(StrEnum):
     """Callback notification status."""
 
     PENDING = "pending"  # 待发送
@@ -52,13 +58,12 @@ def generate_order_no(order_type: OrderType) -> str:
     - Deposit: DEP1702345678000ABC12345
     - Withdraw: WIT1702345678000ABC12345
     """
-    timestamp = int(time.time() * 1000)
-    random_suffix = secrets.token_hex(5).upper()
     prefix = "DEP" if order_type == OrderType.DEPOSIT else "WIT"
-    return f"{prefix}{timestamp}{random_suffix}"
+    # Suffix stays CSPRNG: order numbers appear in public cashier URLs (/pay/{order_no})
+    return f"{prefix}{time.time_ns() // 1_000_000}{secrets.randbits(40):010X}"
 
 
-class Order(SQLModel, table=True):
+class Order(AKXModel, table=True):
     """Payment order model.
 
     Stores both deposit and withdrawal orders with their full lifecycle.
@@ -117,7 +122,7 @@ class Order(SQLModel, table=True):
         description="External trade number from merchant",
     )
     order_type: OrderType = Field(description="Order type: deposit or withdraw")
-    merchant_id: int = Field(foreign_key="users.id", index=True)
+    merchant_id: int = Field(foreign_key="users.id")
 
     # Payment details
     token: str = Field(max_length=20, index=True, description="Token code (uppercase)")
@@ -214,15 +219,25 @@ class Order(SQLModel, table=True):
         default=None,
         description="Order completion time",
     )
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(
+        default=None,
+        sa_column=sa.Column(sa.DateTime, server_default=sa.func.now(), nullable=False),
+    )
+    updated_at: datetime = Field(
+        default=None,
+        sa_column=updated_at_column(),
+    )
 
     # Relationships - use selectin to avoid async lazy-load issues
     merchant: Optional["User"] = Relationship(sa_relationship_kwargs={"lazy": "selectin"})
 
     # Composite unique constraint for merchant + out_trade_no
+    # Merchant order list: merchant_id + order_type filter, newest first
     __table_args__ = (
         sa.UniqueConstraint("merchant_id", "out_trade_no", name="uq_merchant_out_trade_no"),
+        sa.Index(
+            "ix_orders_merchant_type_time", "merchant_id", "order_type", sa.text("created_at DESC")
+        ),
     )
 
     class Config:
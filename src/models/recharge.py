@@ -10,13 +10,19 @@ Note: This is different from Orders.deposit which handles merchant's customer de
 - Deposit Order: Merchant's customer pays merchant (商户客户向商户充值)
 """
 
+import base64
+import itertools
+import os
+import time
 from datetime import datetime
 from decimal import Decimal
-from enum import Enum
+from enum import StrEnum
 from typing import TYPE_CHECKING, Optional
 
 import sqlalchemy as sa
-from sqlmodel import Field, Relationship, SQLModel
+from sqlmodel import Field, Relationship
+
+from src.models._base import AKXModel, updated_at_column
 
 if TYPE_CHECKING:
     from src.models.chain import Chain
@@ -30,7 +36,7 @@ if TYPE_CHECKING:
 # =============================================================================
 
 
-class RechargeAddressStatus(str, Enum):
+class RechargeAddressStatus(StrEnum):
     """Recharge address status."""
 
     AVAILABLE = "available"  # 可用（地址池中未分配）
@@ -39,7 +45,7 @@ class RechargeAddressStatus(str, Enum):
     DISABLED = "disabled"  # 禁用
 
 
-class RechargeAddress(SQLModel, table=True):
+class RechargeAddress(AKXModel, table=True):
     """Recharge address - tracks address pool and merchant assignments.
 
     Each merchant gets a unique recharge address for each chain+token combination.
@@ -80,14 +86,21 @@ class RechargeAddress(SQLModel, table=True):
     last_recharge_at: datetime | None = Field(default=None)
     assigned_at: datetime | None = Field(default=None)
 
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(
+        default=None,
+        sa_column=sa.Column(sa.DateTime, server_default=sa.func.now(), nullable=False),
+    )
+    updated_at: datetime = Field(
+        default=None,
+        sa_column=updated_at_column(),
+    )
 
-    # Relationships - use selectin to avoid async lazy-load issues
-    wallet: Optional["Wallet"] = Relationship(sa_relationship_kwargs={"lazy": "selectin"})
-    chain: Optional["Chain"] = Relationship(sa_relationship_kwargs={"lazy": "selectin"})
-    token: Optional["Token"] = Relationship(sa_relationship_kwargs={"lazy": "selectin"})
-    user: Optional["User"] = Relationship(sa_relationship_kwargs={"lazy": "selectin"})
+    # Relationships - not loaded by default; queries that need them opt in
+    # with joinedload()/selectinload() (async sessions cannot lazy-load)
+    wallet: Optional["Wallet"] = Relationship()
+    chain: Optional["Chain"] = Relationship()
+    token: Optional["Token"] = Relationship()
+    user: Optional["User"] = Relationship()
 
     # Composite index for user+chain+token lookup
     __table_args__ = (
@@ -101,7 +114,7 @@ class RechargeAddress(SQLModel, table=True):
 # =============================================================================
 
 
-class RechargeOrderStatus(str, Enum):
+class RechargeOrderStatus(StrEnum):
     """Recharge order status."""
 
     PENDING = "pending"  # 待支付（等待商户转账）
@@ -112,7 +125,13 @@ class RechargeOrderStatus(str, Enum):
     FAILED = "failed"  # 失败
 
 
-class RechargeOrder(SQLModel, table=True):
+# 仍在等待到账的订单状态（可被链上交易匹配）
+LIVE_RECHARGE_STATUSES = frozenset(
+    {RechargeOrderStatus.PENDING, RechargeOrderStatus.DETECTED, RechargeOrderStatus.CONFIRMING}
+)
+
+
+class RechargeOrder(AKXModel, table=True):
     """Recharge order - tracks merchant balance top-up requests.
 
     When a merchant initiates online recharge:
@@ -163,31 +182,34 @@ class RechargeOrder(SQLModel, table=True):
         sa_column=sa.Column(sa.DECIMAL(32, 8), nullable=True),
     )
 
-    status: RechargeOrderStatus = Field(
-        default=RechargeOrderStatus.PENDING,
-        index=True,
-    )
+    status: RechargeOrderStatus = Field(default=RechargeOrderStatus.PENDING)
     tx_hash: str | None = Field(default=None, max_length=128, index=True)
     confirmations: int = Field(default=0)
     required_confirmations: int = Field(default=19)  # TRON requires 19
 
-    expires_at: datetime = Field(index=True)
+    expires_at: datetime
     detected_at: datetime | None = Field(default=None)
     confirmed_at: datetime | None = Field(default=None)
     credited_at: datetime | None = Field(default=None)
 
-    created_at: datetime = Field(default_factory=datetime.utcnow, index=True)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
-
-    # Relationships - use selectin to avoid async lazy-load issues
-    user: Optional["User"] = Relationship(sa_relationship_kwargs={"lazy": "selectin"})
-    recharge_address: Optional["RechargeAddress"] = Relationship(
-        sa_relationship_kwargs={"lazy": "selectin"}
+    created_at: datetime = Field(
+        default=None,
+        sa_column=sa.Column(sa.DateTime, server_default=sa.func.now(), nullable=False, index=True),
+    )
+    updated_at: datetime = Field(
+        default=None,
+        sa_column=updated_at_column(),
     )
-    chain: Optional["Chain"] = Relationship(sa_relationship_kwargs={"lazy": "selectin"})
-    token: Optional["Token"] = Relationship(sa_relationship_kwargs={"lazy": "selectin"})
 
-    # Indexes
+    # Relationships - not loaded by default; queries that need them opt in
+    # with joinedload()/selectinload() (async sessions cannot lazy-load)
+    user: Optional["User"] = Relationship()
+    recharge_address: Optional["RechargeAddress"] = Relationship()
+    chain: Optional["Chain"] = Relationship()
+    token: Optional["Token"] = Relationship()
+
+    # Indexes: status/expires_at lookups all go through the composites
+    # (the expiry sweep only scans the PENDING range of status_expires)
     __table_args__ = (
         sa.Index("ix_recharge_orders_user_status", "user_id", "status"),
         sa.Index("ix_recharge_orders_status_expires", "status", "expires_at"),
@@ -199,7 +221,7 @@ class RechargeOrder(SQLModel, table=True):
 # =============================================================================
 
 
-class CollectTaskStatus(str, Enum):
+class CollectTaskStatus(StrEnum):
     """Collect task status."""
 
     PENDING = "pending"  # 待执行
@@ -209,7 +231,14 @@ class CollectTaskStatus(str, Enum):
     SKIPPED = "skipped"  # 跳过（余额不足阈值等）
 
 
-class CollectTask(SQLModel, table=True):
+# 未结束的归集任务（同一地址不重复创建）/ 已结束的归集任务
+ACTIVE_COLLECT_STATUSES = frozenset({CollectTaskStatus.PENDING, CollectTaskStatus.PROCESSING})
+FINAL_COLLECT_STATUSES = frozenset(
+    {CollectTaskStatus.SUCCESS, CollectTaskStatus.FAILED, CollectTaskStatus.SKIPPED}
+)
+
+
+class CollectTask(AKXModel, table=True):
     """Collect task - tracks fund collection from recharge addresses to hot wallet.
 
     After merchant recharges, funds need to be collected to hot wallet for:
@@ -254,10 +283,7 @@ class CollectTask(SQLModel, table=True):
         sa_column=sa.Column(sa.DECIMAL(32, 8), nullable=False),
     )
 
-    status: CollectTaskStatus = Field(
-        default=CollectTaskStatus.PENDING,
-        index=True,
-    )
+    status: CollectTaskStatus = Field(default=CollectTaskStatus.PENDING)
     tx_hash: str | None = Field(default=None, max_length=128, index=True)
     gas_used: Decimal | None = Field(
         default=None,
@@ -276,18 +302,22 @@ class CollectTask(SQLModel, table=True):
     executed_at: datetime | None = Field(default=None)
     completed_at: datetime | None = Field(default=None)
 
-    created_at: datetime = Field(default_factory=datetime.utcnow, index=True)
-
-    # Relationships - use selectin to avoid async lazy-load issues
-    recharge_address: Optional["RechargeAddress"] = Relationship(
-        sa_relationship_kwargs={"lazy": "selectin"}
+    created_at: datetime = Field(
+        default=None,
+        sa_column=sa.Column(sa.DateTime, server_default=sa.func.now(), nullable=False, index=True),
     )
-    hot_wallet: Optional["Wallet"] = Relationship(sa_relationship_kwargs={"lazy": "selectin"})
-    chain: Optional["Chain"] = Relationship(sa_relationship_kwargs={"lazy": "selectin"})
-    token: Optional["Token"] = Relationship(sa_relationship_kwargs={"lazy": "selectin"})
 
-    # Indexes
-    __table_args__ = (sa.Index("ix_collect_tasks_status_scheduled", "status", "scheduled_at"),)
+    # Relationships - not loaded by default; queries that need them opt in
+    # with joinedload()/selectinload() (async sessions cannot lazy-load)
+    recharge_address: Optional["RechargeAddress"] = Relationship()
+    hot_wallet: Optional["Wallet"] = Relationship()
+    chain: Optional["Chain"] = Relationship()
+    token: Optional["Token"] = Relationship()
+
+    # Indexes: task pickers filter status + chain and take the oldest first
+    __table_args__ = (
+        sa.Index("ix_collect_tasks_status_chain_created", "status", "chain_id", "created_at"),
+    )
 
 
 # =============================================================================
@@ -295,15 +325,32 @@ class CollectTask(SQLModel, table=True):
 # =============================================================================
 
 
+_recharge_no_prefix = ""
+_recharge_no_counter: "itertools.count[int]" = itertools.count()
+
+
+def _seed_recharge_order_no() -> None:
+    """Pick a random per-process prefix and a time-seeded counter start.
+
+    Re-run in forked children (Celery prefork, gunicorn) so workers never
+    share a (prefix, counter) pair.
+    """
+    global _recharge_no_prefix, _recharge_no_counter
+    _recharge_no_prefix = base64.b32encode(os.urandom(5)).decode()[:5]
+    _recharge_no_counter = itertools.count(time.time_ns() // 1_000_000 & 0xFFFFFFFF)
+
+
+_seed_recharge_order_no()
+os.register_at_fork(after_in_child=_seed_recharge_order_no)
+
+
 def generate_recharge_order_no() -> str:
     """Generate unique recharge order number.
 
-    Format: R + timestamp(10) + random(6)
-    Example: R17042567891234567
-    """
-    import secrets
-    import time
+    Format: R + process prefix(5, base32) + counter(10, hex)
+    Example: R7KQ2M00A1B2C3D4
 
-    timestamp = int(time.time())
-    random_part = secrets.token_hex(3).upper()  # 6 hex chars
-    return f"R{timestamp}{random_part}"
+    Recharge order numbers are only shown to their authenticated owner, so a
+    per-process counter replaces the per-call clock read and random draw.
+    """
+    return f"R{_recharge_no_prefix}{next(_recharge_no_counter):010X}"
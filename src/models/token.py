@@ -3,14 +3,17 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlmodel import Field, Relationship, SQLModel
+import sqlalchemy as sa
+from sqlmodel import Field, Relationship
+
+from src.models._base import AKXModel, updated_at_column
 
 if TYPE_CHECKING:
     from src.models.chain import Chain
     from src.models.token import TokenChainSupport
 
 
-class Token(SQLModel, table=True):
+class Token(AKXModel, table=True):
     """Cryptocurrency token configuration.
 
     Manages supported tokens/currencies independently from chains.
@@ -59,8 +62,14 @@ class Token(SQLModel, table=True):
     )
     is_stablecoin: bool = Field(default=False, description="Is stablecoin")
 
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(
+        default=None,
+        sa_column=sa.Column(sa.DateTime, server_default=sa.func.now(), nullable=False),
+    )
+    updated_at: datetime = Field(
+        default=None,
+        sa_column=updated_at_column(),
+    )
 
     # Relationships
     chain_supports: list["TokenChainSupport"] = Relationship(back_populates="token")
@@ -82,7 +91,7 @@ class Token(SQLModel, table=True):
         }
 
 
-class TokenChainSupport(SQLModel, table=True):
+class TokenChainSupport(AKXModel, table=True):
     """Token support on specific chains.
 
     Many-to-many relationship between tokens and chains.
@@ -133,8 +142,14 @@ class TokenChainSupport(SQLModel, table=True):
         default=None, max_length=50, description="Fixed withdrawal fee"
     )
 
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(
+        default=None,
+        sa_column=sa.Column(sa.DateTime, server_default=sa.func.now(), nullable=False),
+    )
+    updated_at: datetime = Field(
+        default=None,
+        sa_column=updated_at_column(),
+    )
 
     # Relationships
     token: "Token" = Relationship(back_populates="chain_supports")
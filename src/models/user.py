@@ -3,11 +3,13 @@
 import secrets
 from datetime import datetime
 from decimal import Decimal
-from enum import Enum
+from enum import StrEnum
 from typing import TYPE_CHECKING, Optional
 
 import sqlalchemy as sa
-from sqlmodel import Field, Relationship, SQLModel
+from sqlmodel import Field, Relationship
+
+from src.models._base import AKXModel, updated_at_column
 
 if TYPE_CHECKING:
     from src.models.exchange_rate import ExchangeRate
@@ -16,7 +18,7 @@ if TYPE_CHECKING:
     from src.models.wallet import Wallet
 
 
-class UserRole(str, Enum):
+class UserRole(StrEnum):
     """User roles for access control."""
 
     SUPER_ADMIN = "super_admin"
@@ -24,7 +26,11 @@ class UserRole(str, Enum):
     SUPPORT = "support"
 
 
-class SupportPermission(str, Enum):
+# 拥有全部权限的角色
+_ALL_PERMISSION_ROLES = frozenset({UserRole.SUPER_ADMIN, UserRole.MERCHANT})
+
+
+class SupportPermission(StrEnum):
     """Permissions that can be granted to support users by their parent merchant.
 
     Support users can have any combination of these permissions.
@@ -46,7 +52,7 @@ def generate_api_key() -> str:
     return secrets.token_hex(32)
 
 
-class User(SQLModel, table=True):
+class User(AKXModel, table=True):
     """User model - synced from Clerk.
 
     Attributes:
@@ -81,7 +87,7 @@ class User(SQLModel, table=True):
     is_active: bool = Field(default=True)
 
     # Support user fields (子账号) - support users belong to a merchant
-    parent_id: int | None = Field(default=None, foreign_key="users.id", index=True)
+    parent_id: int | None = Field(default=None, foreign_key="users.id")
     permissions: list[str] = Field(
         default=[],
         sa_column=sa.Column(sa.JSON, nullable=False, default=[]),
@@ -104,29 +110,31 @@ class User(SQLModel, table=True):
     withdraw_key: str | None = Field(default=None, max_length=64, index=True)
     fee_config_id: int | None = Field(default=None, foreign_key="fee_configs.id")
 
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(
+        default=None,
+        sa_column=sa.Column(sa.DateTime, server_default=sa.func.now(), nullable=False),
+    )
+    updated_at: datetime = Field(
+        default=None,
+        sa_column=updated_at_column(),
+    )
 
-    # Relationships - use selectin for fee_config to avoid async lazy-load issues
+    # Relationships - not loaded by default (User is fetched on every
+    # authenticated request); queries that need them opt in with selectinload()
     wallets: list["Wallet"] = Relationship(back_populates="user")
-    fee_config: Optional["FeeConfig"] = Relationship(
-        back_populates="users",
-        sa_relationship_kwargs={"lazy": "selectin"},
-    )
+    fee_config: Optional["FeeConfig"] = Relationship(back_populates="users")
     exchange_rates: list["ExchangeRate"] = Relationship(back_populates="user")
     # Merchant settings (one-to-one)
-    merchant_setting: Optional["MerchantSetting"] = Relationship(
-        back_populates="merchant",
-        sa_relationship_kwargs={"lazy": "selectin"},
-    )
+    merchant_setting: Optional["MerchantSetting"] = Relationship(back_populates="merchant")
     # Self-referential relationship for parent merchant
     parent: Optional["User"] = Relationship(
-        sa_relationship_kwargs={
-            "remote_side": "User.id",
-            "lazy": "selectin",
-        },
+        sa_relationship_kwargs={"remote_side": "User.id"},
     )
 
+    # Support user list: parent_id + role filter, newest first
+    # (parent_id leads, so this also serves the foreign key)
+    __table_args__ = (sa.Index("ix_users_parent_role_time", "parent_id", "role", "created_at"),)
+
     # ============ Helper Methods ============
 
     def get_effective_user_id(self) -> int:
@@ -154,14 +162,12 @@ class User(SQLModel, table=True):
             True if user has the permission
         """
         # Super admin and merchant have all permissions
-        if self.role in (UserRole.SUPER_ADMIN, UserRole.MERCHANT):
+        if self.role in _ALL_PERMISSION_ROLES:
             return True
 
         # Support users check their granted permissions
+        # (SupportPermission is a StrEnum, so it compares equal to its stored value)
         if self.role == UserRole.SUPPORT:
-            perm_value = (
-                permission.value if isinstance(permission, SupportPermission) else permission
-            )
-            return perm_value in self.permissions
+            return permission in self.permissions
 
         return False
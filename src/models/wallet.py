@@ -5,11 +5,16 @@ Use the Chain and Token tables (models/chain.py and models/token.py) instead.
 These are kept for backward compatibility during migration.
 """
 
+from collections.abc import Mapping
 from datetime import datetime
-from enum import Enum
+from enum import StrEnum
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Optional
 
-from sqlmodel import Field, Relationship, SQLModel
+import sqlalchemy as sa
+from sqlmodel import Field, Relationship
+
+from src.models._base import AKXModel, updated_at_column
 
 if TYPE_CHECKING:
     from src.models.chain import Chain
@@ -18,7 +23,7 @@ if TYPE_CHECKING:
 
 
 # DEPRECATED: Use Chain table instead
-class ChainEnum(str, Enum):
+class ChainEnum(StrEnum):
     """Supported blockchain networks (DEPRECATED).
 
     This enum is deprecated. Use the Chain table instead.
@@ -30,7 +35,7 @@ class ChainEnum(str, Enum):
 
 
 # DEPRECATED: Use Token table instead
-class TokenEnum(str, Enum):
+class TokenEnum(StrEnum):
     """Supported tokens/currencies (DEPRECATED).
 
     This enum is deprecated. Use the Token table instead.
@@ -94,18 +99,32 @@ PAYMENT_METHOD_EXPIRY_MINUTES_DEPRECATED: dict[ChainEnum, dict[TokenEnum, int]]
 
 DEFAULT_EXPIRY_MINUTES = 30
 
+# Flattened read-only views keyed by (chain, token): one lookup per call
+_EXPIRY_BY_PAIR: Mapping[tuple[ChainEnum, TokenEnum], int] = MappingProxyType(
+    {
+        (chain, token): minutes
+        for chain, tokens in PAYMENT_METHOD_EXPIRY_MINUTES_DEPRECATED.items()
+        for token, minutes in tokens.items()
+    }
+)
+_CONTRACT_BY_PAIR: Mapping[tuple[ChainEnum, TokenEnum], str] = MappingProxyType(
+    {
+        (chain, token): contract
+        for chain, tokens in TOKEN_CONTRACTS_DEPRECATED.items()
+        for token, contract in tokens.items()
+    }
+)
+
 
 # DEPRECATED: Use database queries instead
 def get_payment_method_expiry_deprecated(chain: ChainEnum, token: TokenEnum) -> int:
     """DEPRECATED: Use TokenChainSupport table instead."""
-    return PAYMENT_METHOD_EXPIRY_MINUTES_DEPRECATED.get(chain, {}).get(
-        token, DEFAULT_EXPIRY_MINUTES
-    )
+    return _EXPIRY_BY_PAIR.get((chain, token), DEFAULT_EXPIRY_MINUTES)
 
 
 def get_token_contract_deprecated(chain: ChainEnum, token: TokenEnum) -> str:
     """DEPRECATED: Use TokenChainSupport table instead."""
-    return TOKEN_CONTRACTS_DEPRECATED.get(chain, {}).get(token, "")
+    return _CONTRACT_BY_PAIR.get((chain, token), "")
 
 
 def get_token_decimals_deprecated(token: TokenEnum) -> int:
@@ -113,7 +132,7 @@ def get_token_decimals_deprecated(token: TokenEnum) -> int:
     return TOKEN_DECIMALS_DEPRECATED.get(token, 6)
 
 
-class WalletType(str, Enum):
+class WalletType(StrEnum):
     """Wallet purpose types."""
 
     MERCHANT = "MERCHANT"  # Merchant payment receiving address (商户收款地址)
@@ -123,7 +142,7 @@ class WalletType(str, Enum):
     COLD = "COLD"  # Cold storage for collected funds
 
 
-class Wallet(SQLModel, table=True):
+class Wallet(AKXModel, table=True):
     """Wallet model - blockchain addresses with encrypted private keys.
 
     Security Note:
@@ -149,9 +168,22 @@ class Wallet(SQLModel, table=True):
     """
 
     __tablename__ = "wallets"
+    # Deposit wallet pick: equality on the leading columns, then the index
+    # order is the round-robin order (least recently used first)
+    __table_args__ = (
+        sa.Index(
+            "ix_wallets_deposit_pick",
+            "user_id",
+            "chain_id",
+            "wallet_type",
+            "is_active",
+            "last_used_at",
+            "created_at",
+        ),
+    )
 
     id: int | None = Field(default=None, primary_key=True)
-    user_id: int | None = Field(default=None, foreign_key="users.id", index=True)
+    user_id: int | None = Field(default=None, foreign_key="users.id")
 
     # New: Use foreign keys instead of enums
     chain_id: int = Field(foreign_key="chains.id", index=True)
@@ -167,10 +199,16 @@ class Wallet(SQLModel, table=True):
     balance: str = Field(default="0", max_length=50)
 
     # Round-robin allocation: track last used time for deposit wallet selection
-    last_used_at: datetime | None = Field(default=None, index=True)
+    last_used_at: datetime | None = Field(default=None)
 
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(
+        default=None,
+        sa_column=sa.Column(sa.DateTime, server_default=sa.func.now(), nullable=False),
+    )
+    updated_at: datetime = Field(
+        default=None,
+        sa_column=updated_at_column(),
+    )
 
     # Relationships - use selectin to avoid async lazy-load issues
     user: Optional["User"] = Relationship(back_populates="wallets")
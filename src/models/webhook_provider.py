@@ -1,13 +1,19 @@
 """AKX Crypto Payment Gateway - WebhookProvider model."""
 
 from datetime import datetime
-from enum import Enum
+from enum import StrEnum
+from typing import TYPE_CHECKING
 
-from sqlalchemy import Column, Text
-from sqlmodel import Field, Relationship, SQLModel
+from sqlalchemy import Column, DateTime, Text, func
+from sqlmodel import Field, Relationship
 
+from src.models._base import AKXModel, updated_at_column
 
-class WebhookProviderType(str, Enum):
+if TYPE_CHECKING:
+    from src.models.chain import Chain
+
+
+class WebhookProviderType(StrEnum):
     """Webhook provider types."""
 
     tatum = "tatum"  # Multi-chain including TRON
@@ -19,7 +25,7 @@ class WebhookProviderType(str, Enum):
     custom = "custom"  # Custom webhook
 
 
-class WebhookProvider(SQLModel, table=True):
+class WebhookProvider(AKXModel, table=True):
     """Webhook service provider configuration.
 
     Manages third-party webhook service providers for receiving
@@ -86,13 +92,20 @@ class WebhookProvider(SQLModel, table=True):
     is_enabled: bool = Field(default=True, description="Is provider active")
     remark: str | None = Field(default=None, max_length=500, description="Internal notes")
 
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(
+        default=None,
+        sa_column=Column(DateTime, server_default=func.now(), nullable=False),
+    )
+    updated_at: datetime = Field(
+        default=None,
+        sa_column=updated_at_column(),
+    )
 
-    # Relationships - use selectin to avoid async lazy-load issues
+    # Relationships - not loaded by default; queries that need them opt in
+    # with selectinload() (async sessions cannot lazy-load)
     chain_supports: list["WebhookProviderChain"] = Relationship(
         back_populates="provider",
-        sa_relationship_kwargs={"cascade": "all, delete-orphan", "lazy": "selectin"},
+        sa_relationship_kwargs={"cascade": "all, delete-orphan"},
     )
 
     class Config:
@@ -110,7 +123,7 @@ class WebhookProvider(SQLModel, table=True):
         }
 
 
-class WebhookProviderChain(SQLModel, table=True):
+class WebhookProviderChain(AKXModel, table=True):
     """Association table between WebhookProvider and Chain.
 
     Tracks which chains each webhook provider supports and is configured for.
@@ -144,19 +157,16 @@ class WebhookProviderChain(SQLModel, table=True):
         description="Wallet addresses being monitored (JSON array)",
     )
 
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
-
-    # Relationships - use selectin to avoid async lazy-load issues
-    provider: WebhookProvider = Relationship(
-        back_populates="chain_supports",
-        sa_relationship_kwargs={"lazy": "selectin"},
+    created_at: datetime = Field(
+        default=None,
+        sa_column=Column(DateTime, server_default=func.now(), nullable=False),
     )
-    chain: "Chain" = Relationship(
-        back_populates="webhook_providers",
-        sa_relationship_kwargs={"lazy": "selectin"},
+    updated_at: datetime = Field(
+        default=None,
+        sa_column=updated_at_column(),
     )
 
-
-# Import Chain for type hints
-from src.models.chain import Chain  # noqa: E402
+    # Relationships - not loaded by default; queries that need them opt in
+    # with selectinload() (async sessions cannot lazy-load)
+    provider: WebhookProvider = Relationship(back_populates="chain_supports")
+    chain: "Chain" = Relationship(back_populates="webhook_providers")
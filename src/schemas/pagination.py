@@ -5,20 +5,27 @@ This module provides a customized Page class that uses:
 - Output fields: page, page_size (instead of page, size)
 
 Usage:
-    from src.schemas.pagination import CustomPage
+    from src.schemas.pagination import CustomPage, pagination_ctx
 
-    @router.get("/items")
+    @router.get(
+        "/items",
+        response_model=CustomPage[ItemResponse],
+        dependencies=[Depends(pagination_ctx(CustomPage[ItemResponse]))],
+    )
     async def list_items() -> CustomPage[ItemResponse]:
         return await apaginate(db, query)
+
+Each paginated route declares its pagination context explicitly, so the app
+does not need add_pagination() to walk every route at startup.
 """
 
 from typing import TypeVar
 
 from fastapi import Query
-from fastapi_pagination import Page
+from fastapi_pagination import Page, pagination_ctx
 from fastapi_pagination.customization import CustomizedPage, UseFieldsAliases, UseParamsFields
 
-__all__ = ["CustomPage"]
+__all__ = ["CustomPage", "pagination_ctx"]
 
 T = TypeVar("T")
 
@@ -13,6 +13,7 @@ import asyncio
 import logging
 from decimal import Decimal
 
+from sqlalchemy.orm import joinedload
 from sqlmodel import select
 
 from src.db.engine import close_db, get_session
@@ -73,6 +74,7 @@ async def monitor_loop(tron: TronService) -> None:
                 query = (
                     select(RechargeAddress)
                     .where(RechargeAddress.status == RechargeAddressStatus.ASSIGNED)
+                    .options(joinedload(RechargeAddress.wallet))
                     .limit(BATCH_SIZE)
                 )
 
@@ -1,6 +1,6 @@
 """Chain and Token Service - Business logic for chain/token operations."""
 
-from datetime import datetime, timezone
+import time
 from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -9,6 +9,44 @@ from sqlmodel import select
 from src.models.chain import Chain
 from src.models.token import Token, TokenChainSupport
 
+# Per-process cache of validated (token, chain, support) triples for order creation,
+# keyed by (TOKEN, CHAIN) codes. Values are transient copies, never session-bound.
+_TOKEN_CHAIN_CACHE: dict[tuple[str, str], tuple[tuple[Token, Chain, TokenChainSupport], float]] = {}
+_TOKEN_CHAIN_CACHE_TTL = 60  # seconds, bounds staleness across workers
+
+
+def get_cached_token_chain(
+    token_code: str, chain_code: str
+) -> tuple[Token, Chain, TokenChainSupport] | None:
+    """Return a cached enabled token/chain/support triple, if still fresh."""
+    cached = _TOKEN_CHAIN_CACHE.get((token_code.upper(), chain_code.upper()))
+    if cached is None or time.monotonic() >= cached[1]:
+        return None
+    return cached[0]
+
+
+def cache_token_chain(
+    token_code: str,
+    chain_code: str,
+    token: Token,
+    chain: Chain,
+    support: TokenChainSupport,
+) -> None:
+    """Store detached copies of a validated token/chain/support triple."""
+    _TOKEN_CHAIN_CACHE[(token_code.upper(), chain_code.upper())] = (
+        (
+            Token.model_validate(token.model_dump()),
+            Chain.model_validate(chain.model_dump()),
+            TokenChainSupport.model_validate(support.model_dump()),
+        ),
+        time.monotonic() + _TOKEN_CHAIN_CACHE_TTL,
+    )
+
+
+def invalidate_token_chain_cache() -> None:
+    """Drop all cached token/chain triples (this process only)."""
+    _TOKEN_CHAIN_CACHE.clear()
+
 
 class ChainTokenService:
     """Service for chain and token business logic."""
@@ -120,9 +158,8 @@ class ChainTokenService:
         for field, value in data.items():
             setattr(chain, field, value)
 
-        chain.updated_at = datetime.now(timezone.utc)
-
         await self.db.commit()
+        invalidate_token_chain_cache()
         await self.db.refresh(chain)
         return chain
 
@@ -141,6 +178,7 @@ class ChainTokenService:
 
         await self.db.delete(chain)
         await self.db.commit()
+        invalidate_token_chain_cache()
         return True
 
     # ============ Token Operations ============
@@ -256,9 +294,8 @@ class ChainTokenService:
         for field, value in data.items():
             setattr(token, field, value)
 
-        token.updated_at = datetime.now(timezone.utc)
-
         await self.db.commit()
+        invalidate_token_chain_cache()
         await self.db.refresh(token)
         return token
 
@@ -277,6 +314,7 @@ class ChainTokenService:
 
         await self.db.delete(token)
         await self.db.commit()
+        invalidate_token_chain_cache()
         return True
 
     # ============ Token Chain Support Operations ============
@@ -380,9 +418,8 @@ class ChainTokenService:
         for field, value in data.items():
             setattr(support, field, value)
 
-        support.updated_at = datetime.now(timezone.utc)
-
         await self.db.commit()
+        invalidate_token_chain_cache()
         await self.db.refresh(support)
         return support
 
@@ -401,4 +438,5 @@ class ChainTokenService:
 
         await self.db.delete(support)
         await self.db.commit()
+        invalidate_token_chain_cache()
         return True
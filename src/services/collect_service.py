@@ -13,12 +13,14 @@ from decimal import Decimal
 from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 from sqlmodel import select
 
 from src.core.config import get_settings
-from src.core.security import get_cipher
+from src.core.security import decrypt_private_key
 from src.models.chain import Chain
 from src.models.recharge import (
+    ACTIVE_COLLECT_STATUSES,
     CollectTask,
     CollectTaskStatus,
     RechargeAddress,
@@ -45,8 +47,9 @@ class CollectService:
     def __init__(self, db: AsyncSession, tron_service: TronService | None = None):
         self.db = db
         self.settings = get_settings()
-        self.cipher = get_cipher()
         self.tron = tron_service or get_tron_service()
+        # Sync tronpy client + USDT contract, reused across transfers in a sweep
+        self._usdt_contract: Any = None
 
     # ============ Collection Task Management ============
 
@@ -81,15 +84,19 @@ class CollectService:
             return []
 
         # Find assigned recharge addresses
-        query = select(RechargeAddress).where(
-            RechargeAddress.chain_id == chain.id,
-            RechargeAddress.token_id == token.id,
-            RechargeAddress.status == RechargeAddressStatus.ASSIGNED,
+        query = (
+            select(RechargeAddress)
+            .where(
+                RechargeAddress.chain_id == chain.id,
+                RechargeAddress.token_id == token.id,
+                RechargeAddress.status == RechargeAddressStatus.ASSIGNED,
+            )
+            .options(joinedload(RechargeAddress.wallet))
         )
 
         # Exclude addresses with pending/processing tasks
         pending_subquery = select(CollectTask.recharge_address_id).where(
-            CollectTask.status.in_([CollectTaskStatus.PENDING, CollectTaskStatus.PROCESSING])
+            CollectTask.status.in_(ACTIVE_COLLECT_STATUSES)
         )
         query = query.where(RechargeAddress.id.notin_(pending_subquery))
 
@@ -98,12 +105,22 @@ class CollectService:
 
         created_tasks: list[CollectTask] = []
 
+        # Check actual on-chain balances in one concurrent batch
+        balances = await self.tron.get_usdt_balances(
+            [addr.wallet.address for addr in addresses if addr.wallet]
+        )
+
+        failed_lookups = 0
         for addr in addresses:
             if not addr.wallet:
                 continue
 
-            # Check actual on-chain balance
-            balance = await self.tron.get_usdt_balance(addr.wallet.address)
+            balance = balances[addr.wallet.address]
+
+            # Lookup failed (e.g. rate limited): not a zero balance, retry next scan
+            if balance is None:
+                failed_lookups += 1
+                continue
 
             if balance < self.MIN_COLLECT_AMOUNT:
                 logger.debug(f"Address {addr.wallet.address} balance {balance} below threshold")
@@ -122,6 +139,12 @@ class CollectService:
             created_tasks.append(task)
             logger.info(f"Created collect task for {addr.wallet.address}, amount: {balance}")
 
+        if failed_lookups:
+            logger.warning(
+                f"Balance lookup failed for {failed_lookups}/{len(balances)} addresses; "
+                "they will be rechecked on the next scan"
+            )
+
         await self.db.commit()
         return created_tasks
 
@@ -152,6 +175,10 @@ class CollectService:
                 CollectTask.chain_id == chain.id,
                 CollectTask.status == CollectTaskStatus.PENDING,
             )
+            .options(
+                joinedload(CollectTask.recharge_address).joinedload(RechargeAddress.wallet),
+                joinedload(CollectTask.hot_wallet),
+            )
             .order_by(CollectTask.created_at)
             .limit(max_tasks)
         )
@@ -250,7 +277,7 @@ class CollectService:
         try:
             # Decrypt private key
             encrypted_key = task.recharge_address.wallet.encrypted_private_key
-            private_key = self.cipher.decrypt(encrypted_key)
+            private_key = decrypt_private_key(encrypted_key)
 
             # Execute transfer
             tx_hash = await self._execute_trc20_transfer(
@@ -313,35 +340,41 @@ class CollectService:
         Returns:
             Transaction hash or None on failure
         """
+        # tronpy's sync client does blocking HTTP; keep it off the event loop
+        return await asyncio.to_thread(
+            self._execute_trc20_transfer_sync,
+            from_address,
+            to_address,
+            amount,
+            private_key,
+        )
+
+    def _execute_trc20_transfer_sync(
+        self,
+        from_address: str,
+        to_address: str,
+        amount: Decimal,
+        private_key: str,
+    ) -> str | None:
+        """Blocking TRC20 transfer body, run in a worker thread."""
         try:
             # Use tronpy for local signing (recommended for security)
-            from tronpy import Tron
             from tronpy.keys import PrivateKey
 
-            # Connect to network
-            if self.settings.tron_network == "mainnet":
-                client = Tron()
-            else:
-                client = Tron(network=self.settings.tron_network)
-
-            if self.settings.tron_api_key:
-                client = Tron(
-                    network=self.settings.tron_network
-                    if self.settings.tron_network != "mainnet"
-                    else None,
-                )
-
-            # Get contract
-            contract = client.get_contract(self.tron.USDT_CONTRACT)
+            # Contract ABI is fetched once per sweep, not once per transfer
+            contract = self._get_usdt_contract()
 
             # Convert amount to raw
-            amount_raw = int(amount * Decimal(10**6))
+            amount_raw = int(amount.scaleb(self.tron.USDT_DECIMALS))
 
-            # Build transaction
+            # Build transaction. build() still fetches the ref block per
+            # transfer: sweeps are sequential and infrequent, so one header
+            # round-trip per transfer is cheaper than keeping a shared ref
+            # block fresh (it must stay within the node's recent-block window)
             txn = (
                 contract.functions.transfer(to_address, amount_raw)
                 .with_owner(from_address)
-                .fee_limit(100_000_000)  # 100 TRX max
+                .fee_limit(self.tron.fee_limit)
                 .build()
             )
 
@@ -368,6 +401,27 @@ class CollectService:
             logger.error(f"Transfer error: {e}")
             return None
 
+    def _get_usdt_contract(self) -> Any:
+        """Get the cached sync tronpy USDT contract, connecting on first use."""
+        if self._usdt_contract is None:
+            from tronpy import Tron
+
+            # Connect to network
+            if self.settings.tron_network == "mainnet":
+                client = Tron()
+            else:
+                client = Tron(network=self.settings.tron_network)
+
+            if self.settings.tron_api_key:
+                client = Tron(
+                    network=self.settings.tron_network
+                    if self.settings.tron_network != "mainnet"
+                    else None,
+                )
+
+            self._usdt_contract = client.get_contract(self.tron.USDT_CONTRACT)
+        return self._usdt_contract
+
     async def retry_failed_tasks(
         self,
         chain_code: str = "tron",
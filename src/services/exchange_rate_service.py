@@ -7,8 +7,10 @@ This module provides:
 - External rate sync (OKX C2C, etc.)
 """
 
+import asyncio
 import logging
 import re
+import time
 from decimal import Decimal
 from typing import Any
 
@@ -16,10 +18,40 @@ import httpx
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.db import get_session
 from src.models.exchange_rate import ExchangeRate, ExchangeRateMode, ExchangeRateSource
 
 logger = logging.getLogger(__name__)
 
+# System rate cache (stale-while-revalidate), keyed by (base, quote)
+# Value: (rate or None, monotonic expiry, monotonic hard limit); TTL follows the
+# source's sync_interval, and stale values are only served up to 2x TTL
+_RATE_CACHE: dict[tuple[str, str], tuple[Decimal | None, float, float]] = {}
+_RATE_CACHE_DEFAULT_TTL = 60  # seconds, for manual sources or missing pairs
+_RATE_CACHE_MAX_STALE_FACTOR = 2
+_refreshing: set[tuple[str, str]] = set()
+_background_tasks: set[asyncio.Task[None]] = set()
+
+
+def _cache_key(base_currency: str, quote_currency: str) -> tuple[str, str]:
+    return base_currency.upper(), quote_currency.upper()
+
+
+def invalidate_rate_cache(base_currency: str, quote_currency: str) -> None:
+    """Drop the cached system rate for a pair (this process only)."""
+    _RATE_CACHE.pop(_cache_key(base_currency, quote_currency), None)
+
+
+async def _refresh_system_rate(key: tuple[str, str]) -> None:
+    """Reload a cached system rate in the background with its own session."""
+    try:
+        async with get_session() as db:
+            await ExchangeRateService(db)._load_system_rate(*key)
+    except Exception as e:
+        logger.warning("刷新汇率缓存失败 %s/%s: %s", key[0], key[1], e)
+    finally:
+        _refreshing.discard(key)
+
 
 class ExchangeRateService:
     """Service for exchange rate operations."""
@@ -76,6 +108,7 @@ class ExchangeRateService:
         self.db.add(source)
         await self.db.commit()
         await self.db.refresh(source)
+        invalidate_rate_cache(source.base_currency, source.quote_currency)
         return source
 
     async def update_source(
@@ -94,6 +127,7 @@ class ExchangeRateService:
 
         await self.db.commit()
         await self.db.refresh(source)
+        invalidate_rate_cache(source.base_currency, source.quote_currency)
         return source
 
     async def delete_source(self, source_id: int) -> bool:
@@ -104,6 +138,7 @@ class ExchangeRateService:
 
         await self.db.delete(source)
         await self.db.commit()
+        invalidate_rate_cache(source.base_currency, source.quote_currency)
         return True
 
     # ==================== Merchant Config ====================
@@ -176,11 +211,45 @@ class ExchangeRateService:
     # ==================== Rate Calculation ====================
 
     async def get_system_rate(self, base_currency: str, quote_currency: str) -> Decimal | None:
-        """Get current system rate for a currency pair."""
+        """Get current system rate for a currency pair.
+
+        Served from an in-process cache. Once an entry expires the stale value
+        is still returned while a background task reloads it, so the payment
+        path normally never waits on the database for a known pair. Past 2x TTL
+        (e.g. background refreshes keep failing) the rate is reloaded inline,
+        and a database error propagates instead of pricing with a stale rate.
+        """
+        key = _cache_key(base_currency, quote_currency)
+        cached = _RATE_CACHE.get(key)
+        now = time.monotonic()
+        if cached is None or now >= cached[2]:
+            return await self._load_system_rate(*key)
+
+        rate, expires_at, _ = cached
+        if now >= expires_at and key not in _refreshing:
+            _refreshing.add(key)
+            task = asyncio.create_task(_refresh_system_rate(key))
+            _background_tasks.add(task)
+            task.add_done_callback(_background_tasks.discard)
+        return rate
+
+    async def _load_system_rate(self, base_currency: str, quote_currency: str) -> Decimal | None:
+        """Read the system rate from the database and cache it."""
         source = await self.get_source(base_currency, quote_currency)
-        if source and source.is_enabled and source.current_rate:
-            return source.current_rate
-        return None
+        rate = None
+        ttl = _RATE_CACHE_DEFAULT_TTL
+        if source:
+            if source.is_enabled and source.current_rate:
+                rate = source.current_rate
+            if source.sync_interval > 0:
+                ttl = source.sync_interval
+        now = time.monotonic()
+        _RATE_CACHE[_cache_key(base_currency, quote_currency)] = (
+            rate,
+            now + ttl,
+            now + ttl * _RATE_CACHE_MAX_STALE_FACTOR,
+        )
+        return rate
 
     async def get_merchant_rate(
         self, merchant_id: int, base_currency: str, quote_currency: str
@@ -306,6 +375,7 @@ class ExchangeRateService:
                 # 只在汇率变化时记录
                 if old_rate != source.current_rate:
                     logger.info("%s: %s -> %s", pair, old_rate, source.current_rate)
+                    invalidate_rate_cache(source.base_currency, source.quote_currency)
             else:
                 logger.warning("%s: 无法提取汇率 (path: %s)", pair, source.response_path)
 
@@ -3,6 +3,7 @@
 from decimal import Decimal
 
 from fastapi_pagination.ext.sqlmodel import apaginate
+from sqlalchemy import Row, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
@@ -43,7 +44,7 @@ class LedgerService:
         可用余额 = balance - frozen_balance + credit_limit
 
         Args:
-            user: 用户对象 (需要已刷新)
+            user: 用户对象 (需要在当前事务中 FOR UPDATE 刷新)
             amount: 冻结金额 (正数)
             order_id: 关联订单 ID
             remark: 备注
@@ -176,6 +177,48 @@ class LedgerService:
         self.db.add(ledger)
         return ledger
 
+    # =========================================================================
+    # Balance Update (余额原子变更)
+    # =========================================================================
+
+    async def apply_balance_delta(
+        self,
+        user_id: int,
+        amount: Decimal,
+        check_available: bool = False,
+    ) -> tuple[Decimal, Decimal] | None:
+        """原子地调整用户余额，返回变更前后余额。
+
+        余额在 SQL 中计算 (balance = balance + amount)，不需要先 SELECT 再写回，
+        也不会覆盖并发的余额变动；行锁从 UPDATE 开始持有到事务提交。
+        MySQL 不支持 UPDATE ... RETURNING，变更后余额在同一事务内读回。
+
+        Args:
+            user_id: 用户 ID
+            amount: 变动金额 (正数增加，负数扣除)
+            check_available: 是否要求变更后可用余额 (含赊账额度) 不为负
+
+        Returns:
+            (pre_balance, post_balance)，用户不存在或可用余额不足时返回 None
+        """
+        stmt = (
+            update(User)
+            .where(User.id == user_id)
+            .values(balance=User.balance + amount)
+            .execution_options(synchronize_session=False)
+        )
+        if check_available:
+            stmt = stmt.where(User.balance + amount - User.frozen_balance + User.credit_limit >= 0)
+
+        result = await self.db.execute(stmt)
+        if result.rowcount == 0:
+            return None
+
+        post_balance = (
+            await self.db.execute(select(User.balance).where(User.id == user_id))
+        ).scalar_one()
+        return post_balance - amount, post_balance
+
     # =========================================================================
     # Balance Ledger (积分明细)
     # =========================================================================
@@ -227,8 +270,31 @@ class LedgerService:
         Returns:
             Paginated records
         """
-        # Build query - select only BalanceLedger for pagination
-        query = select(BalanceLedger)
+        # Project only the columns the response needs; joined names come from
+        # outer joins instead of hydrating full User/Order rows per record
+        query = (
+            select(
+                BalanceLedger.id,
+                BalanceLedger.user_id,
+                BalanceLedger.order_id,
+                BalanceLedger.change_type,
+                BalanceLedger.amount,
+                BalanceLedger.pre_balance,
+                BalanceLedger.post_balance,
+                BalanceLedger.frozen_amount,
+                BalanceLedger.pre_frozen,
+                BalanceLedger.post_frozen,
+                BalanceLedger.remark,
+                BalanceLedger.operator_id,
+                BalanceLedger.created_at,
+                Order.order_no,
+                User.email.label("user_email"),
+                User.username.label("user_username"),
+            )
+            .select_from(BalanceLedger)
+            .join(User, User.id == BalanceLedger.user_id, isouter=True)
+            .join(Order, Order.id == BalanceLedger.order_id, isouter=True)
+        )
 
         # Access control: non-admin can only see their own records
         if user.role != UserRole.SUPER_ADMIN:
@@ -248,50 +314,16 @@ class LedgerService:
 
         query = query.order_by(BalanceLedger.created_at.desc())
 
-        # Define async transformer to load related data
-        async def transform_items(items: list[BalanceLedger]) -> list[BalanceLedgerResponse]:
-            result = []
-            for record in items:
-                # Load related data
-                order_no = None
-                user_email = None
-                user_username = None
-
-                if record.order_id:
-                    order = await self.db.get(Order, record.order_id)
-                    order_no = order.order_no if order else None
-
-                if record.user_id:
-                    related_user = await self.db.get(User, record.user_id)
-                    if related_user:
-                        user_email = related_user.email
-                        user_username = related_user.username
-
-                # Build merchant_no (M + user_id)
-                merchant_no = f"M{record.user_id}" if record.user_id else None
-
-                result.append(
-                    BalanceLedgerResponse(
-                        id=record.id,
-                        user_id=record.user_id,
-                        order_id=record.order_id,
-                        change_type=record.change_type,
-                        amount=record.amount,
-                        pre_balance=record.pre_balance,
-                        post_balance=record.post_balance,
-                        frozen_amount=record.frozen_amount,
-                        pre_frozen=record.pre_frozen,
-                        post_frozen=record.post_frozen,
-                        remark=record.remark,
-                        operator_id=record.operator_id,
-                        created_at=record.created_at,
-                        order_no=order_no,
-                        user_email=user_email,
-                        user_username=user_username,
-                        merchant_no=merchant_no,
-                    )
+        # Rows come straight from typed DB columns, so skip field validation
+        def transform_items(rows: list[Row]) -> list[BalanceLedgerResponse]:
+            return [
+                BalanceLedgerResponse.model_construct(
+                    **row._mapping,
+                    # Build merchant_no (M + user_id)
+                    merchant_no=f"M{row.user_id}" if row.user_id else None,
                 )
-            return result
+                for row in rows
+            ]
 
         return await apaginate(
             self.db,
@@ -322,30 +354,20 @@ class LedgerService:
         Raises:
             ValueError: On invalid operation
         """
-        # Get target user
-        target_user = await self.db.get(User, user_id)
-        if not target_user:
-            raise ValueError(f"User {user_id} not found")
-
-        # Check if deduction is possible
-        # 可用余额 = balance - frozen_balance + credit_limit
-        pre_balance = target_user.balance
-        post_balance = pre_balance + amount
-
-        if amount < 0:
-            # 扣款时检查：扣款后可用余额不能为负
-            post_available = post_balance - target_user.frozen_balance + target_user.credit_limit
-            if post_available < 0:
-                current_available = (
-                    pre_balance - target_user.frozen_balance + target_user.credit_limit
-                )
-                raise ValueError(
-                    f"可用余额不足。当前可用: {current_available}, 需要扣除: {abs(amount)}"
-                )
-
-        # Update user balance
-        target_user.balance = post_balance
-        self.db.add(target_user)
+        # Update balance atomically
+        # 扣款时检查：扣款后可用余额 (balance - frozen_balance + credit_limit) 不能为负
+        balances = await self.apply_balance_delta(user_id, amount, check_available=amount < 0)
+        if balances is None:
+            target_user = await self.db.get(User, user_id)
+            if not target_user:
+                raise ValueError(f"User {user_id} not found")
+            current_available = (
+                target_user.balance - target_user.frozen_balance + target_user.credit_limit
+            )
+            raise ValueError(
+                f"可用余额不足。当前可用: {current_available}, 需要扣除: {abs(amount)}"
+            )
+        pre_balance, post_balance = balances
 
         # Create ledger entry
         ledger = await self.create_balance_ledger(
@@ -1,6 +1,6 @@
 """Merchant Settings Service - Business logic for merchant settings."""
 
-from datetime import datetime
+import time
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
@@ -12,6 +12,17 @@ from src.schemas.merchant_setting import (
     TelegramSettingsUpdate,
 )
 
+# Per-process cache of the order-path values: merchant_id -> ((expiry, retries) | None, expires_at)
+# None records "no settings row" so defaults are also served from memory
+_PAYMENT_SETTINGS_CACHE: dict[int, tuple[tuple[int, int] | None, float]] = {}
+_PAYMENT_SETTINGS_CACHE_TTL = 30  # seconds, bounds staleness across workers
+_PAYMENT_SETTINGS_CACHE_MAX = 10_000
+
+
+def invalidate_payment_settings_cache(merchant_id: int) -> None:
+    """Drop the cached payment settings for a merchant (this process only)."""
+    _PAYMENT_SETTINGS_CACHE.pop(merchant_id, None)
+
 
 class MerchantSettingService:
     """Service for managing merchant settings."""
@@ -77,10 +88,10 @@ class MerchantSettingService:
         if data.callback_retry_count is not None:
             settings.callback_retry_count = data.callback_retry_count
 
-        settings.updated_at = datetime.utcnow()
         self.db.add(settings)
         await self.db.commit()
         await self.db.refresh(settings)
+        invalidate_payment_settings_cache(merchant_id)
 
         return settings
 
@@ -111,13 +122,42 @@ class MerchantSettingService:
         if data.telegram_notifications is not None:
             settings.telegram_notifications = data.telegram_notifications
 
-        settings.updated_at = datetime.utcnow()
         self.db.add(settings)
         await self.db.commit()
         await self.db.refresh(settings)
 
         return settings
 
+    async def _get_payment_settings(self, merchant_id: int) -> tuple[int, int] | None:
+        """Get (deposit_expiry_seconds, callback_retry_count), cached briefly.
+
+        Args:
+            merchant_id: Merchant user ID
+
+        Returns:
+            Tuple of settings values, or None if the merchant has no settings
+        """
+        cached = _PAYMENT_SETTINGS_CACHE.get(merchant_id)
+        if cached is not None and time.monotonic() < cached[1]:
+            return cached[0]
+
+        query = select(
+            MerchantSetting.deposit_expiry_seconds,
+            MerchantSetting.callback_retry_count,
+        ).where(MerchantSetting.merchant_id == merchant_id)
+        result = await self.db.execute(query)
+        row = result.one_or_none()
+        values = (row.deposit_expiry_seconds, row.callback_retry_count) if row else None
+
+        if len(_PAYMENT_SETTINGS_CACHE) >= _PAYMENT_SETTINGS_CACHE_MAX:
+            # Evict the oldest entry (dicts keep insertion order)
+            _PAYMENT_SETTINGS_CACHE.pop(next(iter(_PAYMENT_SETTINGS_CACHE)), None)
+        _PAYMENT_SETTINGS_CACHE[merchant_id] = (
+            values,
+            time.monotonic() + _PAYMENT_SETTINGS_CACHE_TTL,
+        )
+        return values
+
     async def get_deposit_expiry_seconds(self, merchant_id: int, default: int = 600) -> int:
         """Get deposit expiry seconds for a merchant.
 
@@ -128,9 +168,9 @@ class MerchantSettingService:
         Returns:
             Deposit expiry seconds
         """
-        settings = await self.get_settings_by_merchant(merchant_id)
-        if settings:
-            return settings.deposit_expiry_seconds
+        values = await self._get_payment_settings(merchant_id)
+        if values:
+            return values[0]
         return default
 
     async def get_callback_retry_count(self, merchant_id: int, default: int = 3) -> int:
@@ -143,7 +183,7 @@ class MerchantSettingService:
         Returns:
             Callback retry count
         """
-        settings = await self.get_settings_by_merchant(merchant_id)
-        if settings:
-            return settings.callback_retry_count
+        values = await self._get_payment_settings(merchant_id)
+        if values:
+            return values[1]
         return default
@@ -4,6 +4,7 @@ from datetime import UTC, datetime
 from typing import Any
 
 from fastapi_pagination.ext.sqlmodel import apaginate
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import col, select
 
@@ -150,7 +151,6 @@ class OrderService:
         # Reset callback status
         order.callback_status = CallbackStatus.PENDING
         order.callback_retry_count = 0
-        order.updated_at = datetime.now(UTC)
 
         await self.db.commit()
         await self.db.refresh(order)
@@ -199,7 +199,6 @@ class OrderService:
         old_status = order.status
         order.status = OrderStatus.SUCCESS
         order.completed_at = datetime.now(UTC)
-        order.updated_at = datetime.now(UTC)
 
         # Add remark
         timestamp = datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S")
@@ -279,7 +278,6 @@ class OrderService:
                 old_status = order.status
                 order.status = OrderStatus.SUCCESS
                 order.completed_at = datetime.now(UTC)
-                order.updated_at = datetime.now(UTC)
 
                 # Add remark
                 timestamp = datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S")
@@ -349,43 +347,34 @@ class OrderService:
         if user.role == UserRole.MERCHANT:
             raise ValueError("Permission denied: only admin/support can retry callbacks")
 
-        success_count = 0
-        failed_count = 0
-        skipped_count = 0
-        success_order_ids: list[int] = []
-
-        # Batch query all orders at once
-        query = select(Order).where(Order.id.in_(data.order_ids))
+        # Only id/status are needed to classify the requested orders
+        query = select(Order.id, Order.status).where(Order.id.in_(data.order_ids))
         result = await self.db.execute(query)
-        orders_map = {order.id: order for order in result.scalars().all()}
-
-        for order_id in data.order_ids:
-            order = orders_map.get(order_id)
-
-            # Order not found
-            if not order:
-                failed_count += 1
-                continue
-
-            # Skip orders not in SUCCESS status
-            if order.status != OrderStatus.SUCCESS:
-                skipped_count += 1
-                continue
-
-            # Retry callback
-            try:
-                order.callback_status = CallbackStatus.PENDING
-                order.callback_retry_count = 0
-                order.updated_at = datetime.now(UTC)
-
-                success_count += 1
-                success_order_ids.append(order_id)
-
-            except Exception:
-                failed_count += 1
-
-        # Commit all changes at once
-        await self.db.commit()
+        status_map = dict(result.all())
+
+        success_order_ids = [
+            order_id
+            for order_id in data.order_ids
+            if status_map.get(order_id) == OrderStatus.SUCCESS
+        ]
+        # Not found -> failed; found but not SUCCESS -> skipped
+        failed_count = sum(1 for order_id in data.order_ids if order_id not in status_map)
+        skipped_count = len(data.order_ids) - len(success_order_ids) - failed_count
+        success_count = len(success_order_ids)
+
+        # Reset callback state in one statement; the status predicate is
+        # re-checked in SQL so a concurrent change can't slip through
+        if success_order_ids:
+            await self.db.execute(
+                update(Order)
+                .where(
+                    Order.id.in_(success_order_ids),
+                    Order.status == OrderStatus.SUCCESS,
+                )
+                .values(callback_status=CallbackStatus.PENDING, callback_retry_count=0)
+                .execution_options(synchronize_session=False)
+            )
+            await self.db.commit()
 
         # Send Celery tasks for successful orders
         for order_id in success_order_ids:
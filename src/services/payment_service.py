@@ -8,12 +8,14 @@ from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any
 
+from sqlalchemy import Row, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
 from src.models.chain import Chain
 from src.models.fee_config import FeeConfig
 from src.models.order import (
+    FINAL_ORDER_STATUSES,
     CallbackStatus,
     Order,
     OrderStatus,
@@ -24,6 +26,7 @@ from src.models.token import Token, TokenChainSupport
 from src.models.user import User, UserRole
 from src.models.wallet import Wallet, WalletType
 from src.schemas.payment import PaymentErrorCode
+from src.services.chain_token_service import cache_token_chain, get_cached_token_chain
 from src.utils.helpers import format_utc_datetime
 
 if TYPE_CHECKING:
@@ -245,6 +248,10 @@ class PaymentService:
         Raises:
             PaymentError: If token/chain is invalid or not supported
         """
+        cached = get_cached_token_chain(token_code, chain_code)
+        if cached is not None:
+            return cached
+
         # Get token
         result = await self.db.execute(
             select(Token).where(
@@ -288,6 +295,7 @@ class PaymentService:
                 f"Token '{token_code}' is not supported on chain '{chain_code}'",
             )
 
+        cache_token_chain(token_code, chain_code, token, chain, support)
         return token, chain, support
 
     async def get_token_chain_support(
@@ -452,7 +460,8 @@ class PaymentService:
 
         # Freeze fee from merchant credits
         # Raises InsufficientBalanceError if balance insufficient
-        await self.db.refresh(merchant)  # Refresh to get latest balance
+        # Lock the merchant row until commit so concurrent orders can't lose a freeze
+        await self.db.refresh(merchant, with_for_update=True)
         await self.ledger_service.freeze_fee(
             user=merchant,
             amount=fee,
@@ -563,7 +572,8 @@ class PaymentService:
 
         # Freeze fee from merchant credits
         # Raises InsufficientBalanceError if balance insufficient
-        await self.db.refresh(merchant)  # Refresh to get latest balance
+        # Lock the merchant row until commit so concurrent orders can't lose a freeze
+        await self.db.refresh(merchant, with_for_update=True)
         await self.ledger_service.freeze_fee(
             user=merchant,
             amount=fee,
@@ -673,7 +683,7 @@ class PaymentService:
             order.tx_hash = tx_hash
         if confirmations is not None:
             order.confirmations = confirmations
-        if new_status in (OrderStatus.SUCCESS, OrderStatus.FAILED, OrderStatus.EXPIRED):
+        if new_status in FINAL_ORDER_STATUSES:
             order.completed_at = datetime.now(UTC)
 
             # Release unique amount suffix for deposit orders
@@ -688,7 +698,6 @@ class PaymentService:
                         f"Failed to release amount suffix for order {order.order_no}: {e}"
                     )
 
-        order.updated_at = datetime.now(UTC)
         self.db.add(order)
         await self.db.commit()
         await self.db.refresh(order)
@@ -772,7 +781,6 @@ class PaymentService:
         """
         order.callback_status = CallbackStatus.SUCCESS
         order.last_callback_at = datetime.now(UTC)
-        order.updated_at = datetime.now(UTC)
         self.db.add(order)
         await self.db.commit()
         await self.db.refresh(order)
@@ -807,7 +815,6 @@ class PaymentService:
         if order.callback_retry_count >= max_retries:
             order.callback_status = CallbackStatus.FAILED
         order.last_callback_at = datetime.now(UTC)
-        order.updated_at = datetime.now(UTC)
         self.db.add(order)
         await self.db.commit()
         await self.db.refresh(order)
@@ -820,7 +827,7 @@ class PaymentService:
         merchant_id: int,
         chain_id: int,
         token_id: int | None,
-    ) -> Wallet | None:
+    ) -> Row[tuple[int, str]] | None:
         """Get an available deposit wallet using round-robin allocation with row locking.
 
         Selection logic:
@@ -832,34 +839,29 @@ class PaymentService:
         This ensures each wallet is used in rotation before repeating,
         and concurrent requests will get different wallets.
 
+        Only the id/address projection is loaded: the caller never needs the
+        full ORM instance (or its chain/token relationship loads).
+
         Args:
             merchant_id: Merchant ID
             chain_id: Chain ID
             token_id: Token ID (optional)
 
         Returns:
-            Available wallet or None
+            (id, address) row of the selected wallet, or None
         """
-        from sqlalchemy import case
-
-        # MySQL doesn't support NULLS FIRST, use CASE expression instead
-        # NULL values get 0 (sorted first), non-NULL get 1 (sorted after)
-        null_first_expr = case(
-            (Wallet.last_used_at.is_(None), 0),
-            else_=1,
-        )
-
         query = (
-            select(Wallet)
+            select(Wallet.id, Wallet.address)
             .where(
                 Wallet.user_id == merchant_id,
                 Wallet.chain_id == chain_id,
-                Wallet.is_active == True,  # noqa: E712
                 Wallet.wallet_type == WalletType.MERCHANT,
+                Wallet.is_active == True,  # noqa: E712
             )
             .order_by(
-                null_first_expr,  # NULL first (unused wallets)
-                Wallet.last_used_at,  # Then by last_used_at ascending
+                # MySQL sorts NULL first in ascending order, so unused wallets
+                # come first and the order is read straight off ix_wallets_deposit_pick
+                Wallet.last_used_at,
                 Wallet.created_at,  # Then by creation time
             )
             .limit(1)
@@ -871,12 +873,16 @@ class PaymentService:
             query = query.where(Wallet.token_id == token_id)
 
         result = await self.db.execute(query)
-        wallet = result.scalar_one_or_none()
+        wallet = result.first()
 
-        # Update last_used_at for round-robin rotation
+        # Update last_used_at for round-robin rotation (row is already locked)
         if wallet:
-            wallet.last_used_at = datetime.now(UTC)
-            self.db.add(wallet)
+            await self.db.execute(
+                update(Wallet)
+                .where(Wallet.id == wallet.id)
+                .values(last_used_at=datetime.now(UTC))
+                .execution_options(synchronize_session=False)
+            )
             # Note: commit is handled by caller (create_deposit_order)
 
         return wallet
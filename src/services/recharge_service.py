@@ -15,8 +15,9 @@ from datetime import datetime, timedelta
 from decimal import Decimal
 from typing import Any
 
-from sqlalchemy import func
+from sqlalchemy import func, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 from sqlmodel import select
 
 from src.core.config import get_settings
@@ -27,6 +28,9 @@ from src.models.ledger import (
     BalanceLedger,
 )
 from src.models.recharge import (
+    ACTIVE_COLLECT_STATUSES,
+    FINAL_COLLECT_STATUSES,
+    LIVE_RECHARGE_STATUSES,
     CollectTask,
     CollectTaskStatus,
     RechargeAddress,
@@ -38,6 +42,7 @@ from src.models.recharge import (
 from src.models.token import Token
 from src.models.user import User
 from src.models.wallet import Wallet, WalletType
+from src.services.ledger_service import LedgerService
 from src.utils.crypto import generate_wallet_for_chain
 from src.utils.helpers import format_utc_datetime
 
@@ -256,13 +261,14 @@ class RechargeService:
         await self.db.commit()
         await self.db.refresh(order)
 
-        # Get chain and token names
+        # Get address, chain and token names (identity-map hits when already loaded)
+        wallet = await self.db.get(Wallet, recharge_address.wallet_id)
         chain = await self.db.get(Chain, recharge_address.chain_id)
         token = await self.db.get(Token, recharge_address.token_id)
 
         return {
             "order_no": order.order_no,
-            "recharge_address": recharge_address.wallet.address if recharge_address.wallet else "",
+            "recharge_address": wallet.address if wallet else "",
             "chain": chain.code if chain else chain_code,
             "chain_name": chain.name if chain else "",
             "token": token.code if token else token_code,
@@ -287,7 +293,11 @@ class RechargeService:
         Returns:
             Order details or None
         """
-        query = select(RechargeOrder).where(RechargeOrder.order_no == order_no)
+        query = (
+            select(RechargeOrder)
+            .where(RechargeOrder.order_no == order_no)
+            .options(*self._order_dict_loads())
+        )
 
         if user:
             query = query.where(RechargeOrder.user_id == user.id)
@@ -318,7 +328,7 @@ class RechargeService:
         Returns:
             List of order dicts
         """
-        query = select(RechargeOrder)
+        query = select(RechargeOrder).options(*self._order_dict_loads())
 
         if user:
             query = query.where(RechargeOrder.user_id == user.id)
@@ -355,7 +365,12 @@ class RechargeService:
             Processing result or None if no pending order
         """
         # Find recharge address
-        addr_query = select(RechargeAddress).join(Wallet).where(Wallet.address == address)
+        addr_query = (
+            select(RechargeAddress)
+            .join(Wallet)
+            .where(Wallet.address == address)
+            .options(joinedload(RechargeAddress.chain), joinedload(RechargeAddress.token))
+        )
 
         addr_result = await self.db.execute(addr_query)
         recharge_address = addr_result.scalar_one_or_none()
@@ -368,13 +383,7 @@ class RechargeService:
             select(RechargeOrder)
             .where(
                 RechargeOrder.recharge_address_id == recharge_address.id,
-                RechargeOrder.status.in_(
-                    [
-                        RechargeOrderStatus.PENDING,
-                        RechargeOrderStatus.DETECTED,
-                        RechargeOrderStatus.CONFIRMING,
-                    ]
-                ),
+                RechargeOrder.status.in_(LIVE_RECHARGE_STATUSES),
             )
             .order_by(RechargeOrder.created_at.desc())
         )
@@ -404,7 +413,6 @@ class RechargeService:
         order.tx_hash = tx_hash
         order.actual_amount = amount
         order.confirmations = confirmations
-        order.updated_at = datetime.utcnow()
 
         if order.status == RechargeOrderStatus.PENDING:
             order.status = RechargeOrderStatus.DETECTED
@@ -441,27 +449,24 @@ class RechargeService:
             order: Confirmed recharge order
             recharge_address: The recharge address
         """
-        user = await self.db.get(User, order.user_id)
-        if not user:
-            return
-
         amount = order.actual_amount or order.expected_amount
-        pre_balance = user.balance
 
-        # Update merchant balance
-        user.balance = user.balance + amount
-        user.updated_at = datetime.utcnow()
+        # Update merchant balance atomically (balance = balance + amount in SQL)
+        balances = await LedgerService(self.db).apply_balance_delta(order.user_id, amount)
+        if balances is None:
+            return
+        pre_balance, post_balance = balances
 
         # Create balance ledger entry - ONLINE_RECHARGE for blockchain deposits
         chain_code = recharge_address.chain.code if recharge_address.chain else "TRON"
         token_code = recharge_address.token.code if recharge_address.token else "USDT"
         ledger = BalanceLedger(
-            user_id=user.id,
+            user_id=order.user_id,
             order_id=order.id,
             change_type=BalanceChangeType.ONLINE_RECHARGE,
             amount=amount,
             pre_balance=pre_balance,
-            post_balance=user.balance,
+            post_balance=post_balance,
             remark=f"Recharge {order.order_no} via {chain_code}-{token_code}",
         )
         self.db.add(ledger)
@@ -469,7 +474,6 @@ class RechargeService:
         # Update recharge address stats
         recharge_address.total_recharged = recharge_address.total_recharged + amount
         recharge_address.last_recharge_at = datetime.utcnow()
-        recharge_address.updated_at = datetime.utcnow()
 
     async def expire_pending_orders(self) -> int:
         """Expire orders that have passed their expiry time.
@@ -479,22 +483,20 @@ class RechargeService:
         Returns:
             Number of orders expired
         """
-        now = datetime.utcnow()
-
-        query = select(RechargeOrder).where(
-            RechargeOrder.status == RechargeOrderStatus.PENDING,
-            RechargeOrder.expires_at < now,
+        # One bulk UPDATE instead of loading and flushing each stale order
+        stmt = (
+            update(RechargeOrder)
+            .where(
+                RechargeOrder.status == RechargeOrderStatus.PENDING,
+                RechargeOrder.expires_at < datetime.utcnow(),
+            )
+            .values(status=RechargeOrderStatus.EXPIRED)
+            .execution_options(synchronize_session=False)
         )
 
-        result = await self.db.execute(query)
-        orders = result.scalars().all()
-
-        for order in orders:
-            order.status = RechargeOrderStatus.EXPIRED
-            order.updated_at = now
-
+        result = await self.db.execute(stmt)
         await self.db.commit()
-        return len(orders)
+        return result.rowcount
 
     # ============ Fund Collection (归集) ============
 
@@ -548,7 +550,7 @@ class RechargeService:
 
         # Exclude addresses with pending collect tasks
         subquery = select(CollectTask.recharge_address_id).where(
-            CollectTask.status.in_([CollectTaskStatus.PENDING, CollectTaskStatus.PROCESSING])
+            CollectTask.status.in_(ACTIVE_COLLECT_STATUSES)
         )
         addresses_query = addresses_query.where(RechargeAddress.id.notin_(subquery))
 
@@ -607,6 +609,10 @@ class RechargeService:
                 CollectTask.chain_id == chain.id,
                 CollectTask.status == CollectTaskStatus.PENDING,
             )
+            .options(
+                joinedload(CollectTask.recharge_address).joinedload(RechargeAddress.wallet),
+                joinedload(CollectTask.hot_wallet),
+            )
             .order_by(CollectTask.created_at)
             .limit(limit)
         )
@@ -662,11 +668,7 @@ class RechargeService:
 
         if status == CollectTaskStatus.PROCESSING:
             task.executed_at = datetime.utcnow()
-        elif status in [
-            CollectTaskStatus.SUCCESS,
-            CollectTaskStatus.FAILED,
-            CollectTaskStatus.SKIPPED,
-        ]:
+        elif status in FINAL_COLLECT_STATUSES:
             task.completed_at = datetime.utcnow()
 
         await self.db.commit()
@@ -674,6 +676,15 @@ class RechargeService:
 
     # ============ Helper Methods ============
 
+    @staticmethod
+    def _order_dict_loads() -> tuple[Any, ...]:
+        """Loader options for the relationships read by _order_to_dict."""
+        return (
+            joinedload(RechargeOrder.recharge_address).joinedload(RechargeAddress.wallet),
+            joinedload(RechargeOrder.chain),
+            joinedload(RechargeOrder.token),
+        )
+
     def _order_to_dict(self, order: RechargeOrder) -> dict[str, Any]:
         """Convert order to dict."""
         address = ""
@@ -12,7 +12,9 @@ import logging
 from decimal import Decimal
 from typing import Any
 
+import base58
 import httpx
+import orjson
 
 from src.core.config import get_settings
 
@@ -25,12 +27,16 @@ class TronService:
     # USDT TRC20 contract address (mainnet)
     USDT_CONTRACT = "TR7NHqjeKQxGTCi8q8ZY4pL8otSzgjLj6t"
 
-    # USDT decimals
+    # TRX / USDT decimals (1 TRX = 1,000,000 SUN)
+    TRX_DECIMALS = 6
     USDT_DECIMALS = 6
 
     # Required confirmations
     REQUIRED_CONFIRMATIONS = 19
 
+    # Max in-flight balance lookups per batch (stays under TronGrid rate limits)
+    BALANCE_QUERY_CONCURRENCY = 8
+
     # API endpoints by network
     API_ENDPOINTS = {
         "mainnet": "https://api.trongrid.io",
@@ -43,18 +49,28 @@ class TronService:
         self.network = self.settings.tron_network
         self.api_key = self.settings.tron_api_key
         self.base_url = self.API_ENDPOINTS.get(self.network, self.API_ENDPOINTS["mainnet"])
+        self.fee_limit = self.settings.tron_fee_limit
         self._client: httpx.AsyncClient | None = None
 
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create HTTP client."""
         if self._client is None or self._client.is_closed:
-            headers = {}
+            # Ask TronGrid for compressed JSON; httpx decompresses transparently
+            headers = {"Accept-Encoding": "gzip, deflate"}
             if self.api_key:
                 headers["TRON-PRO-API-KEY"] = self.api_key
+            # HTTP/2 multiplexes concurrent balance/tx lookups over one kept-alive
+            # TLS connection instead of a handshake per burst
             self._client = httpx.AsyncClient(
                 base_url=self.base_url,
                 headers=headers,
-                timeout=30.0,
+                timeout=httpx.Timeout(30.0, connect=5.0),
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=50,
+                    keepalive_expiry=300.0,
+                ),
+                http2=True,
             )
         return self._client
 
@@ -79,18 +95,44 @@ class TronService:
         try:
             response = await client.get(f"/v1/accounts/{address}")
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             if not data.get("data"):
                 return Decimal("0")
 
             balance_sun = data["data"][0].get("balance", 0)
-            return Decimal(balance_sun) / Decimal("1000000")  # Sun to TRX
+            return Decimal(balance_sun).scaleb(-self.TRX_DECIMALS)  # Sun to TRX
 
         except Exception as e:
             logger.error(f"Failed to get TRX balance for {address}: {e}")
             return Decimal("0")
 
+    async def _fetch_usdt_balance(self, address: str) -> Decimal:
+        """Query the USDT (TRC20) balance for an address, raising on failure."""
+        client = await self._get_client()
+
+        # Constant call to balanceOf(address) with pre-encoded calldata,
+        # instead of listing every TRC20 token the account holds
+        response = await client.post(
+            "/wallet/triggerconstantcontract",
+            json={
+                "owner_address": address,
+                "contract_address": self.USDT_CONTRACT,
+                "function_selector": "balanceOf(address)",
+                "parameter": self._encode_address_param(address),
+                "visible": True,
+            },
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+
+        constant_result = data.get("constant_result")
+        if not constant_result or not constant_result[0]:
+            return Decimal("0")
+
+        balance_raw = int(constant_result[0], 16)
+        return Decimal(balance_raw).scaleb(-self.USDT_DECIMALS)
+
     async def get_usdt_balance(self, address: str) -> Decimal:
         """Get USDT (TRC20) balance for an address.
 
@@ -98,32 +140,39 @@ class TronService:
             address: TRON address (base58)
 
         Returns:
-            Balance in USDT
+            Balance in USDT (0 if the lookup failed)
         """
-        client = await self._get_client()
-
         try:
-            response = await client.get(
-                f"/v1/accounts/{address}/tokens",
-                params={"only_trc20": "true"},
-            )
-            response.raise_for_status()
-            data = response.json()
+            return await self._fetch_usdt_balance(address)
+        except Exception as e:
+            logger.error(f"Failed to get USDT balance for {address}: {e}")
+            return Decimal("0")
 
-            if not data.get("data"):
-                return Decimal("0")
+    async def get_usdt_balances(self, addresses: list[str]) -> dict[str, Decimal | None]:
+        """Get USDT (TRC20) balances for many addresses concurrently.
 
-            # Find USDT token
-            for token in data["data"]:
-                if token.get("token_id") == self.USDT_CONTRACT:
-                    balance_raw = int(token.get("balance", 0))
-                    return Decimal(balance_raw) / Decimal(10**self.USDT_DECIMALS)
+        Requests share the HTTP client with at most BALANCE_QUERY_CONCURRENCY
+        in flight, so a large batch doesn't trip TronGrid rate limits.
 
-            return Decimal("0")
+        Args:
+            addresses: TRON addresses (base58)
 
-        except Exception as e:
-            logger.error(f"Failed to get USDT balance for {address}: {e}")
-            return Decimal("0")
+        Returns:
+            Mapping of address to USDT balance, or None where the lookup failed
+            (so callers can tell an error from a real zero balance)
+        """
+        semaphore = asyncio.Semaphore(self.BALANCE_QUERY_CONCURRENCY)
+
+        async def fetch(address: str) -> Decimal | None:
+            async with semaphore:
+                try:
+                    return await self._fetch_usdt_balance(address)
+                except Exception as e:
+                    logger.error(f"Failed to get USDT balance for {address}: {e}")
+                    return None
+
+        balances = await asyncio.gather(*(fetch(a) for a in addresses))
+        return dict(zip(addresses, balances, strict=True))
 
     async def get_account_resources(self, address: str) -> dict[str, Any]:
         """Get account resources (bandwidth, energy).
@@ -139,7 +188,7 @@ class TronService:
         try:
             response = await client.get(f"/v1/accounts/{address}/resources")
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             if not data.get("data"):
                 return {"energy": 0, "bandwidth": 0}
@@ -201,12 +250,12 @@ class TronService:
                 params=params,
             )
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             transactions = []
             for tx in data.get("data", []):
                 amount_raw = int(tx.get("value", 0))
-                amount = Decimal(amount_raw) / Decimal(10**self.USDT_DECIMALS)
+                amount = Decimal(amount_raw).scaleb(-self.USDT_DECIMALS)
 
                 transactions.append(
                     {
@@ -245,7 +294,7 @@ class TronService:
                 json={"value": tx_hash},
             )
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             if not data:
                 return None
@@ -275,7 +324,7 @@ class TronService:
         try:
             response = await client.post("/wallet/getnowblock")
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             return data.get("block_header", {}).get("raw_data", {}).get("number", 0)
 
@@ -292,11 +341,13 @@ class TronService:
         Returns:
             Number of confirmations
         """
-        tx_info = await self.get_transaction_info(tx_hash)
+        tx_info, current_block = await asyncio.gather(
+            self.get_transaction_info(tx_hash),
+            self.get_current_block(),
+        )
         if not tx_info or not tx_info.get("block_number"):
             return 0
 
-        current_block = await self.get_current_block()
         if current_block == 0:
             return 0
 
@@ -326,7 +377,7 @@ class TronService:
         contract = contract_address or self.USDT_CONTRACT
 
         # Convert amount to raw (with decimals)
-        amount_raw = int(amount * Decimal(10**self.USDT_DECIMALS))
+        amount_raw = int(amount.scaleb(self.USDT_DECIMALS))
 
         try:
             # Build transfer parameter
@@ -339,12 +390,12 @@ class TronService:
                     "contract_address": contract,
                     "function_selector": "transfer(address,uint256)",
                     "parameter": self._encode_transfer_params(to_address, amount_raw),
-                    "fee_limit": 100000000,  # 100 TRX max fee
+                    "fee_limit": self.fee_limit,
                     "call_value": 0,
                 },
             )
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             if data.get("result", {}).get("result"):
                 return data.get("transaction")
@@ -356,6 +407,19 @@ class TronService:
             logger.error(f"Failed to build TRC20 transfer: {e}")
             return None
 
+    @staticmethod
+    def _encode_address_param(address: str) -> str:
+        """ABI-encode a base58 TRON address as a 32-byte word.
+
+        Args:
+            address: TRON address (base58)
+
+        Returns:
+            64 hex chars: 20-byte account id left-padded with zeros
+        """
+        # Drop the 0x41 network prefix byte
+        return base58.b58decode_check(address)[1:].hex().rjust(64, "0")
+
     def _encode_transfer_params(self, to_address: str, amount: int) -> str:
         """Encode transfer function parameters.
 
@@ -369,13 +433,8 @@ class TronService:
         # Convert base58 address to hex (remove T prefix and convert)
         # This is a simplified version - in production use tronpy library
         try:
-            import base58
-
-            addr_bytes = base58.b58decode_check(to_address)
-            addr_hex = addr_bytes.hex()[2:]  # Remove 41 prefix
-
             # Pad address to 32 bytes
-            addr_padded = addr_hex.zfill(64)
+            addr_padded = self._encode_address_param(to_address)
 
             # Pad amount to 32 bytes
             amount_hex = hex(amount)[2:].zfill(64)
@@ -1,27 +1,20 @@
 """User Service - Business logic for user management."""
 
-from datetime import UTC, datetime
 from decimal import Decimal
 
 import pyotp
 from fastapi_pagination.ext.sqlmodel import apaginate
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from sqlmodel import select
 
-from src.core.config import get_settings
-from src.core.security import AESCipher
+from src.core.security import get_cipher
 from src.models.fee_config import FeeConfig
 from src.models.user import SupportPermission, User, UserRole, generate_api_key
 from src.schemas.pagination import CustomPage
 from src.schemas.user import UserResponse
 
 
-def _get_cipher() -> AESCipher:
-    """Get AES cipher for encrypting/decrypting secrets."""
-    settings = get_settings()
-    return AESCipher(settings.aes_encryption_key)
-
-
 class UserService:
     """Service for user-related business logic."""
 
@@ -46,7 +39,11 @@ class UserService:
         Returns:
             Paginated user list
         """
-        query = select(User).where(User.role != UserRole.SUPER_ADMIN)
+        query = (
+            select(User)
+            .where(User.role != UserRole.SUPER_ADMIN)
+            .options(selectinload(User.fee_config))
+        )
 
         if search:
             # Escape special LIKE characters to prevent pattern injection
@@ -75,7 +72,10 @@ class UserService:
             User or None
         """
         result = await self.db.execute(
-            select(User).where(User.id == user_id).where(User.role != UserRole.SUPER_ADMIN)
+            select(User)
+            .where(User.id == user_id)
+            .where(User.role != UserRole.SUPER_ADMIN)
+            .options(selectinload(User.fee_config))
         )
         return result.scalar_one_or_none()
 
@@ -100,10 +100,9 @@ class UserService:
             return None
 
         user.role = role
-        user.updated_at = datetime.now(UTC)
         self.db.add(user)
         await self.db.commit()
-        await self.db.refresh(user)
+        await self._refresh_user(user)
         return user
 
     async def update_user_status(self, user_id: int, is_active: bool) -> User | None:
@@ -121,10 +120,9 @@ class UserService:
             return None
 
         user.is_active = is_active
-        user.updated_at = datetime.now(UTC)
         self.db.add(user)
         await self.db.commit()
-        await self.db.refresh(user)
+        await self._refresh_user(user)
         return user
 
     async def update_user_balance(self, user_id: int, balance: Decimal) -> User | None:
@@ -142,10 +140,9 @@ class UserService:
             return None
 
         user.balance = balance
-        user.updated_at = datetime.now(UTC)
         self.db.add(user)
         await self.db.commit()
-        await self.db.refresh(user)
+        await self._refresh_user(user)
         return user
 
     async def update_user_credit_limit(self, user_id: int, credit_limit: Decimal) -> User | None:
@@ -169,10 +166,9 @@ class UserService:
             return None
 
         user.credit_limit = credit_limit
-        user.updated_at = datetime.now(UTC)
         self.db.add(user)
         await self.db.commit()
-        await self.db.refresh(user)
+        await self._refresh_user(user)
         return user
 
     async def update_user_fee_config(self, user_id: int, fee_config_id: int | None) -> User | None:
@@ -198,10 +194,9 @@ class UserService:
                 raise ValueError("Fee config not found")
 
         user.fee_config_id = fee_config_id
-        user.updated_at = datetime.now(UTC)
         self.db.add(user)
         await self.db.commit()
-        await self.db.refresh(user)
+        await self._refresh_user(user)
         return user
 
     async def reset_deposit_key(self, user_id: int) -> str | None:
@@ -219,7 +214,6 @@ class UserService:
 
         new_key = generate_api_key()
         user.deposit_key = new_key
-        user.updated_at = datetime.now(UTC)
         self.db.add(user)
         await self.db.commit()
         return new_key
@@ -239,7 +233,6 @@ class UserService:
 
         new_key = generate_api_key()
         user.withdraw_key = new_key
-        user.updated_at = datetime.now(UTC)
         self.db.add(user)
         await self.db.commit()
         return new_key
@@ -260,10 +253,9 @@ class UserService:
         secret = pyotp.random_base32()
 
         # Encrypt the secret before storing (marked as pending until enabled)
-        cipher = _get_cipher()
+        cipher = get_cipher()
         encrypted_secret = cipher.encrypt(f"pending:{secret}")
         user.google_secret = encrypted_secret
-        user.updated_at = datetime.now(UTC)
         self.db.add(user)
         await self.db.commit()
 
@@ -345,7 +337,6 @@ class UserService:
                 raise ValueError(f"Invalid permission: {perm}")
 
         user.permissions = permissions
-        user.updated_at = datetime.now(UTC)
 
         self.db.add(user)
         await self.db.commit()
@@ -382,7 +373,6 @@ class UserService:
             raise ValueError("User is not a support user")
 
         user.is_active = is_active
-        user.updated_at = datetime.now(UTC)
 
         self.db.add(user)
         await self.db.commit()
@@ -423,8 +413,12 @@ class UserService:
         user.is_active = False
         user.parent_id = None
         user.permissions = []
-        user.updated_at = datetime.now(UTC)
 
         self.db.add(user)
         await self.db.commit()
         return True
+
+    async def _refresh_user(self, user: User) -> None:
+        """Reload a committed user, including fee_config (read by UserResponse)."""
+        await self.db.refresh(user)
+        await self.db.refresh(user, ["fee_config"])
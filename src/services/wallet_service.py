@@ -3,6 +3,7 @@
 from typing import Any
 
 from fastapi_pagination.ext.sqlmodel import apaginate
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from sqlmodel import select
@@ -174,7 +175,7 @@ class WalletService:
         # Generate wallets (support users create wallets for their parent merchant)
         effective_user_id = user.get_effective_user_id()
         cipher = get_cipher()
-        created_wallets: list[Wallet] = []
+        rows: list[dict[str, Any]] = []
 
         for _ in range(count):
             address, private_key = generate_wallet_for_chain(chain.code)
@@ -189,12 +190,20 @@ class WalletService:
                 wallet_type=WalletType.MERCHANT,
                 is_active=True,
             )
-            self.db.add(wallet)
-            created_wallets.append(wallet)
+            # Timestamps are left to the server defaults
+            rows.append(wallet.model_dump(exclude={"id", "created_at", "updated_at"}))
 
+        # One executemany INSERT instead of a per-row flush (MySQL has no
+        # RETURNING, so the ORM would INSERT row by row to fetch each id),
+        # then read the batch back by address in a single SELECT
+        await self.db.execute(insert(Wallet), rows)
         await self.db.commit()
-        for w in created_wallets:
-            await self.db.refresh(w)
+
+        addresses = [row["address"] for row in rows]
+        result = await self.db.execute(
+            select(Wallet).where(Wallet.address.in_(addresses)).order_by(Wallet.id)
+        )
+        created_wallets = list(result.scalars().all())
 
         return created_wallets, chain
 
@@ -2,10 +2,11 @@
 
 import json
 import logging
-from datetime import UTC, datetime
+from typing import Any
 
 from fastapi_pagination.ext.sqlmodel import apaginate
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from sqlmodel import select
 
 from src.core.security import decrypt_sensitive_data, encrypt_sensitive_data
@@ -44,7 +45,7 @@ class WebhookProviderService:
             Paginated providers
         """
         # Build query
-        stmt = select(WebhookProvider)
+        stmt = select(WebhookProvider).options(*self._response_loads())
 
         if provider_type:
             stmt = stmt.where(WebhookProvider.provider_type == provider_type)
@@ -66,7 +67,11 @@ class WebhookProviderService:
         Returns:
             Provider response or None if not found
         """
-        stmt = select(WebhookProvider).where(WebhookProvider.id == provider_id)
+        stmt = (
+            select(WebhookProvider)
+            .where(WebhookProvider.id == provider_id)
+            .options(*self._response_loads())
+        )
         result = await self.db.execute(stmt)
         provider = result.scalars().first()
 
@@ -165,8 +170,6 @@ class WebhookProviderService:
                 encrypt_sensitive_data(data.webhook_secret) if data.webhook_secret else None
             )
 
-        provider.updated_at = datetime.now(UTC)
-
         # Update chain supports if provided
         if data.chain_ids is not None:
             # Remove existing chain supports
@@ -295,6 +298,7 @@ class WebhookProviderService:
                 WebhookProviderChain.is_enabled == True,  # noqa: E712
                 Chain.code == chain_code,
             )
+            .options(*self._response_loads())
         )
         result = await self.db.execute(stmt)
         providers = result.scalars().all()
@@ -334,11 +338,17 @@ class WebhookProviderService:
         if contract_addresses is not None:
             chain_support.contract_addresses = json.dumps(contract_addresses)
 
-        chain_support.updated_at = datetime.now(UTC)
         await self.db.commit()
 
         return True
 
+    @staticmethod
+    def _response_loads() -> tuple[Any, ...]:
+        """Loader options for the relationships read by _to_response."""
+        return (
+            selectinload(WebhookProvider.chain_supports).selectinload(WebhookProviderChain.chain),
+        )
+
     def _to_response(self, provider: WebhookProvider) -> WebhookProviderResponse:
         """Convert provider model to response schema.
 
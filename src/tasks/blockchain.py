@@ -78,7 +78,6 @@ async def _check_transaction_confirmations(db, order: Order):
 
     # Update confirmation count
     order.confirmations = tx_info.confirmations
-    order.updated_at = datetime.now(UTC)
 
     logger.info(
         f"Order {order.order_no} has "
@@ -156,7 +155,6 @@ async def _process_withdraw(order_id: str):
 
         # Update status to processing
         order.status = OrderStatus.PROCESSING
-        order.updated_at = datetime.now(UTC)
         await db.commit()
 
         try:
@@ -199,12 +197,10 @@ async def _process_withdraw(order_id: str):
                 order.tx_hash = result.tx_hash
                 order.from_address = wallet.address
                 order.status = OrderStatus.CONFIRMING
-                order.updated_at = datetime.now(UTC)
                 logger.info(f"Withdrawal sent for order {order.order_no}: tx={result.tx_hash}")
             else:
                 order.status = OrderStatus.FAILED
                 order.error_message = result.error_message or "Transaction failed"
-                order.updated_at = datetime.now(UTC)
                 logger.error(
                     f"Withdrawal failed for order {order.order_no}: {result.error_message}"
                 )
@@ -216,7 +212,6 @@ async def _process_withdraw(order_id: str):
             logger.error(f"Error processing withdrawal {order.order_no}: {e}")
             order.status = OrderStatus.FAILED
             order.error_message = str(e)
-            order.updated_at = datetime.now(UTC)
 
             # Trigger callback for failure
             send_callback.delay(str(order.id))
@@ -4,10 +4,10 @@ import asyncio
 import logging
 
 from celery import shared_task
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
 from src.core.config import get_settings
+from src.db.engine import MYSQL_CONNECT_ARGS
 from src.services.exchange_rate_service import ExchangeRateService
 
 logger = logging.getLogger(__name__)
@@ -23,10 +23,10 @@ def _create_task_session() -> tuple:
         pool_pre_ping=True,
         pool_size=5,
         max_overflow=10,
+        connect_args=MYSQL_CONNECT_ARGS,
     )
-    session_factory = sessionmaker(
+    session_factory = async_sessionmaker(
         engine,
-        class_=AsyncSession,
         expire_on_commit=False,
     )
     return engine, session_factory
@@ -33,18 +33,20 @@ async def _get_merchant_telegram_settings(
 
     try:
         async with get_session() as db:
-            query = select(MerchantSetting).where(MerchantSetting.merchant_id == merchant_id)
+            # Only the three notification columns; skips building the entity
+            # and the selectin load of its merchant (User) relationship
+            query = select(
+                MerchantSetting.telegram_bot_enabled,
+                MerchantSetting.telegram_chat_id,
+                MerchantSetting.telegram_notifications,
+            ).where(MerchantSetting.merchant_id == merchant_id)
             result = await db.execute(query)
-            settings = result.scalar_one_or_none()
+            row = result.one_or_none()
 
-            if not settings:
+            if not row:
                 return False, None, []
 
-            return (
-                settings.telegram_bot_enabled,
-                settings.telegram_chat_id,
-                settings.telegram_notifications,
-            )
+            return row.telegram_bot_enabled, row.telegram_chat_id, row.telegram_notifications
     finally:
         await close_db()
 
@@ -2,7 +2,7 @@
 
 from decimal import ROUND_DOWN, Decimal
 
-from src.core.redis import get_redis
+from src.core.redis import get_redis, get_redis_pipeline
 
 # Amount suffix range: 1-9 (add 0.001 ~ 0.009 to the original amount)
 SUFFIX_MIN = 1
@@ -52,31 +52,30 @@ async def generate_unique_amount(
         payment_amount = 100.123
         possible results: 100.124, 100.125, ..., 100.132
     """
-    r = get_redis()
-
     # Get base amount (truncated to 3 decimals)
     base_amount_3dp = _get_base_amount_3dp(payment_amount)
     redis_key = _build_redis_key(wallet_address, base_amount_3dp)
+    counter_key = f"{redis_key}:counter"
+    used_key = f"{redis_key}:used"
 
     # Try to find an available suffix using Redis SET for atomic operations
-    for _ in range(SUFFIX_COUNT + 1):  # +1 for safety
-        # Atomic increment counter to get next suffix candidate
-        counter_key = f"{redis_key}:counter"
-        counter = await r.incr(counter_key)
-        await r.expire(counter_key, ttl_seconds)
+    async with get_redis_pipeline() as pipe:
+        for _ in range(SUFFIX_COUNT + 1):  # +1 for safety
+            # Atomic increment counter to get next suffix candidate (one round-trip)
+            results = await pipe.incr(counter_key).expire(counter_key, ttl_seconds).execute()
+            counter = results[0]
 
-        # Calculate suffix (1-9)
-        suffix = (counter % SUFFIX_COUNT) + 1
+            # Calculate suffix (1-9)
+            suffix = (counter % SUFFIX_COUNT) + 1
 
-        # Try to add suffix to used set (atomic SADD returns 1 if new, 0 if exists)
-        used_key = f"{redis_key}:used"
-        added = await r.sadd(used_key, suffix)
-        await r.expire(used_key, ttl_seconds)
+            # Try to add suffix to used set (atomic SADD returns 1 if new, 0 if exists)
+            results = await pipe.sadd(used_key, suffix).expire(used_key, ttl_seconds).execute()
+            added = results[0]
 
-        if added == 1:
-            # Successfully reserved this suffix
-            final_amount = base_amount_3dp + Decimal(suffix) / Decimal(1000)
-            return final_amount
+            if added == 1:
+                # Successfully reserved this suffix
+                final_amount = base_amount_3dp + Decimal(suffix) / Decimal(1000)
+                return final_amount
 
     # All 9 suffixes are occupied
     raise ValueError(
@@ -108,13 +107,19 @@ async def release_amount_suffix(
     amount_3dp = _get_base_amount_3dp(amount)
 
     # Try suffixes 1-9 to find which base amount this came from
-    for suffix in range(SUFFIX_MIN, SUFFIX_MAX + 1):
-        potential_base = amount_3dp - Decimal(suffix) / Decimal(1000)
-        redis_key = _build_redis_key(wallet_address, potential_base)
-        used_key = f"{redis_key}:used"
-
-        # Check if this suffix exists in the set
-        is_member = await r.sismember(used_key, suffix)
+    suffixes = range(SUFFIX_MIN, SUFFIX_MAX + 1)
+    used_keys = [
+        f"{_build_redis_key(wallet_address, amount_3dp - Decimal(suffix) / Decimal(1000))}:used"
+        for suffix in suffixes
+    ]
+
+    # Check all candidate sets in one round-trip
+    async with get_redis_pipeline() as pipe:
+        for suffix, used_key in zip(suffixes, used_keys, strict=True):
+            pipe.sismember(used_key, suffix)
+        memberships = await pipe.execute()
+
+    for suffix, used_key, is_member in zip(suffixes, used_keys, memberships, strict=True):
         if is_member:
             # Found it, remove from set
             removed = await r.srem(used_key, suffix)
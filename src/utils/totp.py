@@ -8,17 +8,10 @@ from typing import Any
 import pyotp
 from fastapi import HTTPException
 
-from src.core.config import get_settings
-from src.core.security import AESCipher
+from src.core.security import get_cipher
 from src.models.user import User
 
 
-def _get_cipher() -> AESCipher:
-    """Get AES cipher for decrypting TOTP secrets."""
-    settings = get_settings()
-    return AESCipher(settings.aes_encryption_key)
-
-
 def decrypt_totp_secret(encrypted_secret: str) -> str | None:
     """Decrypt TOTP secret from database.
 
@@ -26,7 +19,7 @@ def decrypt_totp_secret(encrypted_secret: str) -> str | None:
         Decrypted secret or None if invalid/pending
     """
     try:
-        cipher = _get_cipher()
+        cipher = get_cipher()
         decrypted = cipher.decrypt(encrypted_secret)
         # 排除 pending 状态的密钥
         if decrypted.startswith("pending:"):